@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import pycountry
 import json
 import defusedxml.ElementTree as etree
@@ -22,10 +24,21 @@ from docassemble.base.util import (
     path_and_mimetype,
 )
 import zipfile
+import atexit
+import copy
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Union, Optional, Any
 import os.path
+from functools import lru_cache
 from os import listdir
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = [
     "post_file_to_legalserver_documents_webhook",
     "country_code_from_name",
@@ -86,9 +99,64 @@ __all__ = [
     "is_zip_file",
     "get_legalserver_report_data",
     "list_templates",
+    "get_details_in_bulk",
+    "get_cached_user_details",
+    "get_cached_contact_details",
+    "get_cached_organization_details",
+    "populate_matter_bundle",
 ]
 
+# One Session is shared by every LegalServer call so connections are kept
+# alive and reused between requests, including from worker threads. GET
+# requests that fail to connect, hit a rate limit, or get a temporary server
+# error are retried with a short backoff; uploads are never retried. A read
+# timeout is not retried, since LegalServer may still be working on the
+# request. A Retry-After header on a 429 or 503 is honoured, but the wait is
+# capped at `_RETRY_AFTER_MAX` seconds so it cannot hold up an interview. The
+# last response is returned either way so the existing status code handling
+# still applies.
+_RETRY_AFTER_MAX = 10
+
+
+class LegalServerRetry(Retry):
+    """Retry that caps the wait requested by a Retry-After header."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+
+_RETRY = LegalServerRetry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY)
+)
+
+# One thread pool is shared by every call that fans out so threads are reused
+# between calls instead of being started and stopped each time. It matches the
+# Session's connection pool size.
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="LegalServerLink")
+atexit.register(_EXECUTOR.shutdown, wait=False)
 
+
+def running_on_executor() -> bool:
+    """Helper function to check whether the caller is one of `_EXECUTOR`'s
+    worker threads. A worker that waits on the pool for more work can deadlock
+    once every worker is waiting, so it should do that work itself."""
+    return threading.current_thread().name.startswith("LegalServerLink_")
+
+
+@lru_cache(maxsize=256)
 def country_code_from_name(country_name_string: str) -> str:
     """Uses PyCountry to convert a country's name to the ISO alpha_2 code.
 
@@ -106,7 +174,8 @@ def country_code_from_name(country_name_string: str) -> str:
     Returns:
         A string with the ISO alpha_2 code. If either a country cannot be mapped
         to the given name or multiple countries could be mapped to the name
-        then `Unknown` is returned instead.
+        then `Unknown` is returned instead. Results are cached, so the fuzzy
+        search only runs once for each name.
     """
 
     country_code = "Unknown"
@@ -139,6 +208,7 @@ def country_code_from_name(country_name_string: str) -> str:
     return country_code
 
 
+@lru_cache(maxsize=256)
 def language_code_from_name(language_name: str) -> str:
     """Uses PyCountry to convert a language from a string to the ISO Alpha 2
     code.
@@ -154,7 +224,8 @@ def language_code_from_name(language_name: str) -> str:
     Returns:
         A string with the ISO alpha_2 code. If either a language cannot be
         mapped to the given name or multiple languages could be mapped to the
-        name then `Unknown` is returned instead.
+        name then `Unknown` is returned instead. Results are cached, so an
+        unknown language is only logged the first time.
     """
 
     language_code = "Unknown"
@@ -245,9 +316,9 @@ def post_file_to_legalserver_documents_webhook(
         payload["save_to_sharepoint"] = True  # type: ignore
 
     if is_zip_file(file_path):
-        files = {"files": ("files.zip", open(file_path, "rb"))}
+        file_name = "files.zip"
     else:
-        files = {"files": (os.path.basename(file_path), open(file_path, "rb"))}
+        file_name = os.path.basename(file_path)
         log(f"This file will not generate a case note since it is not a zip file.")
 
     log(
@@ -256,9 +327,14 @@ def post_file_to_legalserver_documents_webhook(
     )
     return_dict: Dict
     try:
-        response = requests.post(
-            url, data=payload, files=files, headers=header_content, timeout=(3, 30)
-        )
+        with open(file_path, "rb") as file:
+            response = _SESSION.post(
+                url,
+                data=payload,
+                files={"files": (file_name, file)},
+                headers=header_content,
+                timeout=(3, 30),
+            )
         response.raise_for_status()
 
         if response.status_code != 200:
@@ -274,18 +350,9 @@ def post_file_to_legalserver_documents_webhook(
                 f"LegalServer Saving Document success: {str(response.status_code)},"
                 f" {response.json().get('uuid')}"
             )
-    except requests.exceptions.ConnectionError as e:
-        log(f"LegalServer saving document failed: {e}")
-        return {"error": e}
-    except requests.exceptions.HTTPError as e:
-        log(f"LegalServer saving document failed: {e}")
-        return {"error": e}
-    except requests.exceptions.Timeout as e:
-        log(f"LegalServer saving document failed: {e}")
-        return {"error": e}
     except Exception as e:
-        log(f"LegalServer saving document failed: {e}")
-        return {"error": e}
+        log(f"LegalServer saving document failed: {type(e).__name__}: {e}")
+        return {"error": str(e)}
     return return_dict  # type: ignore
 
 
@@ -433,28 +500,21 @@ def search_organization_data(
         Errors are handled in the response. Errors will be present when the dictionary response includes a key of 'error'
 
     """
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-    if not organization_search_params:
-        organization_search_params = {}
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/organizations"
-    if custom_fields:
-        organization_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        organization_search_params["sort"] = "asc"
-    elif sort == "desc":
-        organization_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="organizations",
-        params=organization_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint="organizations",
+        source_type="organizations",
+        search_params=organization_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
+
+# Times that a site's token was last found to be unexpired, keyed by (site,
+# bearer token, expiration) so a configuration change is checked right away.
+_TOKEN_CACHE: Dict = {}
+_TOKEN_CACHE_SECONDS = 300
 
 
 def get_legalserver_token(*, legalserver_site: str) -> Dict[str, str]:
@@ -482,9 +542,15 @@ def get_legalserver_token(*, legalserver_site: str) -> Dict[str, str]:
         raise Exception(f"No bearer token for {legalserver_site}")
     if apikey.get("expiration") is None:
         raise Exception(f"No token expiration date for {legalserver_site}")
-    else:
+    # the expiration only needs to be compared to the current date every few
+    # minutes, not for every request
+    key = (legalserver_site.lower(), apikey["bearer"], apikey["expiration"])
+    now = time.monotonic()
+    checked = _TOKEN_CACHE.get(key)
+    if checked is None or now - checked >= _TOKEN_CACHE_SECONDS:
         if date_difference(starting=apikey.get("expiration"), ending=current_datetime()).days > 0:  # type: ignore
             raise Exception(f"Bearer token for {legalserver_site} has expired")
+        _TOKEN_CACHE[key] = now
     return {"Authorization": "Bearer " + str(apikey["bearer"])}
 
 
@@ -541,31 +607,16 @@ def search_matter_notes_data(
 
     Returns:
         A list of dictionaries with the notes data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/notes"
-
-    if not search_note_params:
-        search_note_params = {}
-    if note_type:
-        search_note_params["note_type"] = note_type
-    if sort == "asc":
-        search_note_params["sort"] = "asc"
-    elif sort == "desc":
-        search_note_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="notes",
-        params=search_note_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/notes",
+        source_type="notes",
+        search_params=search_note_params,
+        filter_params={"note_type": note_type},
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_litigation_data(
     *,
@@ -595,31 +646,16 @@ def search_matter_litigation_data(
 
     Returns:
         A list of dictionaries with the litigation data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/litigations"
-
-    if not litigation_search_params:
-        litigation_search_params = {}
-    if custom_fields:
-        litigation_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        litigation_search_params["sort"] = "asc"
-    elif sort == "desc":
-        litigation_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="litigation",
-        params=litigation_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/litigations",
+        source_type="litigation",
+        search_params=litigation_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_services_data(
     *,
@@ -647,29 +683,15 @@ def search_matter_services_data(
 
     Returns:
         A list of dictionaries with the services data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/services"
-    if not services_search_params:
-        services_search_params = {}
-    if custom_fields:
-        services_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        services_search_params["sort"] = "asc"
-    elif sort == "desc":
-        services_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="services",
-        params=services_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/services",
+        source_type="services",
+        search_params=services_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
-    )
-
-    return return_data  # type: ignore
+    )  # type: ignore
 
 
 def search_matter_charges_data(
@@ -698,30 +720,16 @@ def search_matter_charges_data(
 
     Returns:
         A list of dictionaries with the charges data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/charges"
-    if not charges_search_params:
-        charges_search_params = {}
-    if custom_fields:
-        charges_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        charges_search_params["sort"] = "asc"
-    elif sort == "desc":
-        charges_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="charges",
-        params=charges_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/charges",
+        source_type="charges",
+        search_params=charges_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_contacts_data(
     *,
@@ -748,27 +756,14 @@ def search_matter_contacts_data(
 
     Returns:
         A list of dictionaries with the contacts data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/contacts"
-    if not matter_contact_search_params:
-        matter_contact_search_params = {}
-    if sort == "asc":
-        matter_contact_search_params["sort"] = "asc"
-    elif sort == "desc":
-        matter_contact_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="matter_contact",
-        params=matter_contact_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/contacts",
+        source_type="matter_contact",
+        search_params=matter_contact_search_params,
+        sort=sort,
         page_limit=page_limit,
-    )
-
-    return return_data  # type: ignore
+    )  # type: ignore
 
 
 def search_matter_assignments_data(
@@ -796,29 +791,15 @@ def search_matter_assignments_data(
 
     Returns:
         A list of dictionaries with the assignment data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/assignments"
-
-    if not matter_assignment_search_params:
-        matter_assignment_search_params = {}
-    if sort == "asc":
-        matter_assignment_search_params["sort"] = "asc"
-    elif sort == "desc":
-        matter_assignment_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="assignments",
-        params=matter_assignment_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/assignments",
+        source_type="assignments",
+        search_params=matter_assignment_search_params,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_additional_names(
     *,
@@ -845,29 +826,15 @@ def search_matter_additional_names(
 
     Returns:
         A list of dictionaries with the additional names data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/additional_names"
-
-    if not matter_additional_names_search_params:
-        matter_additional_names_search_params = {}
-    if sort == "asc":
-        matter_additional_names_search_params["sort"] = "asc"
-    elif sort == "desc":
-        matter_additional_names_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="additional_names",
-        params=matter_additional_names_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/additional_names",
+        source_type="additional_names",
+        search_params=matter_additional_names_search_params,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_non_adverse_parties(
     *,
@@ -892,30 +859,16 @@ def search_matter_non_adverse_parties(
         page_limit (int): Optional integer to limit the number of results returned.
 
     Returns:
-        A list of dictionaries with the Adverse Parties data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/non_adverse_parties"
-
-    if not matter_non_adverse_parties_search_params:
-        matter_non_adverse_parties_search_params = {}
-    if sort == "asc":
-        matter_non_adverse_parties_search_params["sort"] = "asc"
-    elif sort == "desc":
-        matter_non_adverse_parties_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="adverse_parties",
-        params=matter_non_adverse_parties_search_params,
+        A list of dictionaries with the Non-Adverse Parties data."""
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/non_adverse_parties",
+        source_type="non_adverse_parties",
+        search_params=matter_non_adverse_parties_search_params,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_matter_adverse_parties(
     *,
@@ -941,29 +894,15 @@ def search_matter_adverse_parties(
 
     Returns:
         A list of dictionaries with the Adverse Parties data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/matters/{legalserver_matter_uuid}/adverse_parties"
-
-    if not matter_adverse_parties_search_params:
-        matter_adverse_parties_search_params = {}
-    if sort == "asc":
-        matter_adverse_parties_search_params["sort"] = "asc"
-    elif sort == "desc":
-        matter_adverse_parties_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="adverse_parties",
-        params=matter_adverse_parties_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"matters/{legalserver_matter_uuid}/adverse_parties",
+        source_type="adverse_parties",
+        search_params=matter_adverse_parties_search_params,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_user_organization_affiliation(
     *,
@@ -982,21 +921,12 @@ def search_user_organization_affiliation(
 
     Returns:
         A list of dictionaries with the Adverse Parties data."""
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/users/{legalserver_user_uuid}/organization_affiliation"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="organization_affiliation",
-        params={},
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint=f"users/{legalserver_user_uuid}/organization_affiliation",
+        source_type="organization_affiliation",
     )
 
-    return return_data
-
 
 def get_user_details(
     *,
@@ -1075,30 +1005,16 @@ def search_user_data(
         Errors are handled in the response. Errors will be present when the
         dictionary response includes a key of 'error'
     """
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/users"
-    if not user_search_params:
-        user_search_params = {}
-    if custom_fields:
-        user_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        user_search_params["sort"] = "asc"
-    elif sort == "desc":
-        user_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="user",
-        params=user_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint="users",
+        source_type="user",
+        search_params=user_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def get_contact_details(
     *,
@@ -1146,6 +1062,100 @@ def get_contact_details(
     return return_data
 
 
+# get_*_details functions and their uuid parameter, by record type.
+_DETAILS_FUNCTIONS: Dict[str, tuple] = {
+    "matters": (get_matter_details, "legalserver_matter_uuid"),
+    "contacts": (get_contact_details, "legalserver_contact_uuid"),
+    "organizations": (get_organization_details, "legalserver_organization_uuid"),
+    "users": (get_user_details, "legalserver_user_uuid"),
+}
+
+
+def get_details_in_bulk(
+    *,
+    legalserver_site: str,
+    legalserver_matter_uuids: list | None = None,
+    legalserver_contact_uuids: list | None = None,
+    legalserver_organization_uuids: list | None = None,
+    legalserver_user_uuids: list | None = None,
+) -> Dict:
+    """Get the details for several LegalServer records at the same time.
+
+    This is a keyword defined function that runs the `get_matter_details`,
+    `get_contact_details`, `get_organization_details`, and `get_user_details`
+    calls for every supplied uuid on a thread pool. The calls are independent,
+    so the total wait is about as long as the slowest request instead of the
+    sum of all of them. Only the API calls run on the pool, the responses can
+    then be passed to the populate functions as usual.
+
+    Args:
+        legalserver_site (str): required
+        legalserver_matter_uuids (list[str]): optional list of matter uuids
+        legalserver_contact_uuids (list[str]): optional list of contact uuids
+        legalserver_organization_uuids (list[str]): optional list of
+            organization uuids
+        legalserver_user_uuids (list[str]): optional list of user uuids
+
+    Returns:
+        A dictionary with `matters`, `contacts`, `organizations`, and `users`
+        keys. Each one is a dictionary of the responses keyed by uuid.
+
+    Raises:
+        Errors are handled in the response for each uuid. Errors will be present
+        when that dictionary response includes a key of 'error'
+    """
+    requests_to_make = []
+    for key, uuids in (
+        ("matters", legalserver_matter_uuids),
+        ("contacts", legalserver_contact_uuids),
+        ("organizations", legalserver_organization_uuids),
+        ("users", legalserver_user_uuids),
+    ):
+        function, uuid_keyword = _DETAILS_FUNCTIONS[key]
+        for uuid in uuids or []:
+            requests_to_make.append((key, uuid, function, {uuid_keyword: uuid}))
+
+    return_data: Dict = {
+        "matters": {},
+        "contacts": {},
+        "organizations": {},
+        "users": {},
+    }
+    if not requests_to_make:
+        return return_data
+
+    # a call from a pool worker makes its requests itself instead of waiting
+    # on the pool, which could otherwise deadlock
+    details_map = map if running_on_executor() else _EXECUTOR.map
+    responses = details_map(
+        lambda request: request[2](legalserver_site=legalserver_site, **request[3]),
+        requests_to_make,
+    )
+    for (key, uuid, _, _), response in zip(requests_to_make, responses):
+        return_data[key][uuid] = response
+
+    return return_data
+
+
+def decode_response(response: requests.Response) -> Any:
+    """Helper function to decode a LegalServer JSON response.
+
+    Uses orjson when it is installed since the case and search responses can be
+    large, otherwise falls back to the standard library through requests.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Last ETag and data seen for each detail request, keyed by (url, params,
+# Authorization). When LegalServer sends an ETag the next request for the same
+# record is made conditional, and a 304 reuses the stored data.
+_ETAG_CACHE: Dict = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+_ETAG_CACHE_SIZE = 256
+
+
 def get_legalserver_response(
     url: str,
     params: Dict,
@@ -1156,16 +1166,27 @@ def get_legalserver_response(
 ) -> Dict:
     """Helper function to properly get a specific piece of LegalServer data."""
     return_data = {}
+    etag_key = (url, repr(sorted(params.items())), header_content.get("Authorization"))
+    with _ETAG_CACHE_LOCK:
+        cached = _ETAG_CACHE.get(etag_key)
+    if cached is not None:
+        header_content = {**header_content, "If-None-Match": cached[0]}
     try:
         log(
             f"Get {source_type} request of {uuid} on: {legalserver_site} "
             f"included a request for custom fields: {str(params)}"
         )
-        response = requests.get(
+        response = _SESSION.get(
             url, params=params, headers=header_content, timeout=(3, 30)
         )
         response.raise_for_status()
-        if response.status_code != 200:
+        if response.status_code == 304 and cached is not None:
+            log(
+                f"LegalServer {source_type} data for {uuid} on "
+                f"{legalserver_site} has not changed. Response 304"
+            )
+            return_data = copy.deepcopy(cached[1])
+        elif response.status_code != 200:
             return_data = {"error": response.status_code}
             log(
                 f"Error getting LegalServer {source_type} data for {uuid} "
@@ -1177,7 +1198,14 @@ def get_legalserver_response(
                 f"Got LegalServer {source_type} data for {uuid} on "
                 f"{legalserver_site}. Response {str(response.status_code)}"
             )
-            return_data = response.json().get("data")
+            return_data = decode_response(response).get("data")
+            etag = response.headers.get("ETag")
+            if etag and isinstance(return_data, dict):
+                with _ETAG_CACHE_LOCK:
+                    _ETAG_CACHE.pop(etag_key, None)
+                    _ETAG_CACHE[etag_key] = (etag, copy.deepcopy(return_data))
+                    if len(_ETAG_CACHE) > _ETAG_CACHE_SIZE:
+                        _ETAG_CACHE.pop(next(iter(_ETAG_CACHE)))
     except requests.exceptions.ConnectionError as e:
         log(
             f"Error getting LegalServer {source_type} data for {uuid} "
@@ -1213,7 +1241,7 @@ def search_contact_data(
     *,
     legalserver_site: str,
     contact_search_params: dict | None = None,
-    custom_fields=[],
+    custom_fields: list | None = None,
     sort: str | None = None,
     page_limit: int | None = None,
 ) -> List[Dict]:
@@ -1238,31 +1266,128 @@ def search_contact_data(
         Errors are handled in the response. Errors will be present when the
         dictionary response includes a key of 'error'
     """
+    return search_legalserver_data(
+        legalserver_site=legalserver_site,
+        endpoint="contacts",
+        source_type="contact",
+        search_params=contact_search_params,
+        custom_fields=custom_fields,
+        sort=sort,
+        page_limit=page_limit,
+    )
+
+
+# Search results keyed by (site, endpoint, search parameters, page limit). Each
+# entry is the time it was requested and the records. Only used when the
+# `search cache seconds` setting is above zero.
+_SEARCH_CACHE: Dict = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_CACHE_SIZE = 128
+
+
+def search_cache_seconds() -> float:
+    """Check how long the search functions may reuse an earlier result.
+
+    This reads the optional `search cache seconds` key from the `legalserver`
+    block of the Docassemble configuration. It is 0, so every search is sent to
+    LegalServer, by default.
+
+    Args:
+        None.
+
+    Returns:
+        The number of seconds a search result can be reused for.
+    """
+    legalserver_config = docassemble.base.functions.get_config("legalserver") or {}
+    return float(legalserver_config.get("search cache seconds", 0) or 0)
+
+
+def search_legalserver_data(
+    *,
+    legalserver_site: str,
+    endpoint: str,
+    source_type: str,
+    search_params: dict | None = None,
+    filter_params: dict | None = None,
+    custom_fields: list | None = None,
+    sort: str | None = None,
+    page_limit: int | None = None,
+) -> List:
+    """Helper function to run a LegalServer Search API request for the search
+    functions.
+
+    `endpoint` is the part of the url after `/api/v2/`. Any `filter_params`
+    with a value, the custom fields, and the sort order (`asc` or `desc` in any
+    case) are added to a copy of the search parameters before every page of
+    results is collected."""
     header_content = get_legalserver_token(legalserver_site=legalserver_site)
     header_content["Content-Type"] = "application/json"
 
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/contacts"
-    if not contact_search_params:
-        contact_search_params = {}
+    url = f"https://{legalserver_site}.legalserver.org/api/v2/{endpoint}"
+    extra_params = {key: value for key, value in (filter_params or {}).items() if value}
     if custom_fields:
-        contact_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        contact_search_params["sort"] = "asc"
-    elif sort == "desc":
-        contact_search_params["sort"] = "desc"
+        extra_params["custom_fields"] = custom_fields
+    if sort and sort.lower() in ("asc", "desc"):
+        extra_params["sort"] = sort.lower()
+    # build a new dictionary so the caller's search parameters are left as is
+    search_params = {**(search_params or {}), **extra_params}
+
+    cache_seconds = search_cache_seconds()
+    if cache_seconds > 0:
+        cache_key = (
+            legalserver_site,
+            endpoint,
+            json.dumps(search_params, sort_keys=True, default=str),
+            page_limit,
+        )
+        with _SEARCH_CACHE_LOCK:
+            cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_seconds:
+            log(
+                f"Reusing {len(cached[1])} LegalServer {source_type} records from {url}."
+            )
+            return copy.deepcopy(cached[1])
 
     return_data = loop_through_legalserver_responses(
         url=url,
-        source_type="contact",
-        params=contact_search_params,
+        source_type=source_type,
+        params=search_params,
         legalserver_site=legalserver_site,
         header_content=header_content,
         page_limit=page_limit,
     )
 
+    # errors are not saved so the next call tries LegalServer again
+    if cache_seconds > 0 and not (len(return_data) == 1 and "error" in return_data[0]):
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE.pop(cache_key, None)
+            _SEARCH_CACHE[cache_key] = (time.monotonic(), copy.deepcopy(return_data))
+            if len(_SEARCH_CACHE) > _SEARCH_CACHE_SIZE:
+                _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
     return return_data
 
 
+def get_legalserver_search_page(
+    url: str, params: Dict, header_content: Dict, source_type: str
+) -> requests.Response:
+    """Helper function to request a single page of a LegalServer Search and log
+    any response other than a 200."""
+    response = _SESSION.get(url, params=params, headers=header_content, timeout=(3, 30))
+    response.raise_for_status()
+    if response.status_code != 200:
+        log(
+            f"Error searching LegalServer {source_type} data for params:"
+            f" {str(params)} on {url}. {str(response.status_code)}: "
+            f"{str(response.json())}"
+        )
+    return response
+
+
+# Most search pages requested at the same time for a single search, so one
+# large search does not take over the shared thread pool.
+_SEARCH_PAGES_IN_FLIGHT = 8
+
+
 def loop_through_legalserver_responses(
     url: str,
     params: Dict,
@@ -1271,68 +1396,87 @@ def loop_through_legalserver_responses(
     legalserver_site: str,
     page_limit: int | None = None,
 ) -> List:
-    """Helper function to properly loop through LegalServer Search Responses."""
+    """Helper function to properly loop through LegalServer Search Responses.
+
+    The first page is requested on its own to learn the total number of pages.
+    The remaining pages, up to `page_limit`, are then requested on the shared
+    thread pool, at most `_SEARCH_PAGES_IN_FLIGHT` at a time, and their records
+    are added in page order. If a page fails, the pages that have not started
+    yet are cancelled. A search that is already running on the thread pool
+    requests them one at a time instead."""
     return_data = []
-    total_number_of_pages = 1
-    counter = 0
 
-    while (
-        counter < total_number_of_pages
-        and total_number_of_pages > 0
-        and (page_limit is None or counter < page_limit)
-    ):
-        try:
-            log(
-                f"Search {source_type} records with params: {str(params)} on: " f"{url}"
+    log(f"Search {source_type} records with params: {str(params)} on: {url}")
+    if page_limit is not None and page_limit < 1:
+        log(f"Got 0 LegalServer {source_type} records from {url}.")
+        return return_data
+    try:
+        response = get_legalserver_search_page(url, params, header_content, source_type)
+        if response.status_code != 200:
+            return [{"error": response.status_code}]
+        # decode each page once and keep only its records, so the parsed page
+        # and its raw body can be freed before the next one is decoded
+        response_json = decode_response(response)
+        return_data.extend(response_json.get("data"))
+        total_number_of_pages = response_json.get("total_number_of_pages") or 1
+        if page_limit is not None:
+            total_number_of_pages = min(total_number_of_pages, page_limit)
+        del response_json, response
+
+        def fetch_page(page_number: int) -> requests.Response:
+            return get_legalserver_search_page(
+                url, {**params, "page_number": page_number}, header_content, source_type
             )
-            response = requests.get(
-                url, params=params, headers=header_content, timeout=(3, 30)
+
+        for first_page in range(2, total_number_of_pages + 1, _SEARCH_PAGES_IN_FLIGHT):
+            page_numbers = range(
+                first_page,
+                min(first_page + _SEARCH_PAGES_IN_FLIGHT, total_number_of_pages + 1),
             )
-            response.raise_for_status()
-            if response.status_code != 200:
-                return_data = [{"error": response.status_code}]
-                log(
-                    f"Error searching LegalServer {source_type} data for params:"
-                    f" {str(params)} on {url}. {str(response.status_code)}: "
-                    f"{str(response.json())}"
-                )
-                break
+            futures = []
+            if running_on_executor():
+                responses = map(fetch_page, page_numbers)
             else:
-                log(
-                    f"Got LegalServer {source_type} data for params: {str(params)} "
-                    f"on {url}. Response {str(response.status_code)}"
-                )
-                return_data.extend(response.json().get("data"))
-                if response.json().get("total_number_of_pages") is not None:
-                    total_number_of_pages = response.json().get("total_number_of_pages")
-                    counter += 1
-                    params["page_number"] = counter + 1
-                else:
-                    break
-        except requests.exceptions.ConnectionError as e:
-            log(
-                f"Error getting LegalServer {source_type} data for {str(params)} "
-                f"on {url}. Exception raised: {str(e)}."
-            )
-            return [{"error": str(e)}]
-        except requests.exceptions.HTTPError as e:
-            log(
-                f"Error getting LegalServer {source_type} data for {str(params)} "
-                f"on {url}. Exception raised: {str(e)}."
-            )
-            return [{"error": str(e)}]
-        except requests.exceptions.Timeout as e:
-            log(
-                f"Error getting LegalServer {source_type} data for {str(params)} "
-                f"on {url}. Exception raised: {str(e)}."
-            )
-            return [{"error": str(e)}]
-        except Exception as e:
-            log(
-                f"Error searching LegalServer {source_type} data for {str(params)} "
-                f"on {url}. Exception raised: {str(e)}."
-            )
-            return [{"error": "Unknown"}]
+                futures = [
+                    _EXECUTOR.submit(fetch_page, page_number)
+                    for page_number in page_numbers
+                ]
+                responses = (future.result() for future in futures)
+            try:
+                for response in responses:
+                    if response.status_code != 200:
+                        return [{"error": response.status_code}]
+                    response_json = decode_response(response)
+                    return_data.extend(response_json.get("data"))
+                    del response_json, response
+            finally:
+                for future in futures:
+                    future.cancel()
+    except requests.exceptions.ConnectionError as e:
+        log(
+            f"Error getting LegalServer {source_type} data for {str(params)} "
+            f"on {url}. Exception raised: {str(e)}."
+        )
+        return [{"error": str(e)}]
+    except requests.exceptions.HTTPError as e:
+        log(
+            f"Error getting LegalServer {source_type} data for {str(params)} "
+            f"on {url}. Exception raised: {str(e)}."
+        )
+        return [{"error": str(e)}]
+    except requests.exceptions.Timeout as e:
+        log(
+            f"Error getting LegalServer {source_type} data for {str(params)} "
+            f"on {url}. Exception raised: {str(e)}."
+        )
+        return [{"error": str(e)}]
+    except Exception as e:
+        log(
+            f"Error searching LegalServer {source_type} data for {str(params)} "
+            f"on {url}. Exception raised: {str(e)}."
+        )
+        return [{"error": "Unknown"}]
+    log(f"Got {len(return_data)} LegalServer {source_type} records from {url}.")
     return return_data
 
 
@@ -1365,37 +1509,23 @@ def search_document_data(
         A list of dictionaries of matching documents.
     """
 
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/documents"
-    if not document_search_params:
-        document_search_params = {}
-    if legalserver_matter_uuid:
-        document_search_params["matters"] = legalserver_matter_uuid
-    if sort == "asc":
-        document_search_params["sort"] = "asc"
-    elif sort == "desc":
-        document_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="documents",
-        params=document_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint="documents",
+        source_type="documents",
+        search_params=document_search_params,
+        filter_params={"matters": legalserver_matter_uuid},
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def search_task_data(
     *,
     legalserver_site: str,
     legalserver_matter_uuid: str | None = None,
     task_search_params: dict | None = None,
-    custom_fields=[],
+    custom_fields: list | None = None,
     sort: str | None = None,
     page_limit: int | None = None,
 ) -> List[Dict]:
@@ -1423,31 +1553,153 @@ def search_task_data(
         Errors are handled in the response. Errors will be present when the
         dictionary response includes a key of 'error'
     """
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/tasks"
-    if not task_search_params:
-        task_search_params = {}
-    if legalserver_matter_uuid:
-        task_search_params["matters"] = legalserver_matter_uuid
-    if custom_fields:
-        task_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        task_search_params["sort"] = "asc"
-    elif sort == "desc":
-        task_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="tasks",
-        params=task_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint="tasks",
+        source_type="tasks",
+        search_params=task_search_params,
+        filter_params={"matters": legalserver_matter_uuid},
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
+
+def set_lookup_value(target: Any, attribute: str, data: dict, key: str) -> None:
+    """Helper function to save the `lookup_value_name` of a LegalServer lookup
+    field as an attribute when both the field and its value are present."""
+    lookup = data.get(key)
+    if lookup is not None:
+        lookup_value_name = lookup.get("lookup_value_name")
+        if lookup_value_name is not None:
+            setattr(target, attribute, lookup_value_name)
+
+
+def set_lookup_values(target: Any, attribute: str, data: dict, key: str) -> None:
+    """Helper function to save the `lookup_value_name` of each entry in a
+    LegalServer multi-select lookup field as a list attribute when at least one
+    value is present."""
+    lookup_value_names = [
+        lookup.get("lookup_value_name")
+        for lookup in data.get(key) or ()
+        if lookup.get("lookup_value_name") is not None
+    ]
+    if lookup_value_names:
+        setattr(target, attribute, lookup_value_names)
+
+
+def set_custom_fields(target: Any, data: dict, standard_keys: frozenset) -> None:
+    """Helper function to save the keys of a LegalServer record that are not in
+    `standard_keys` as a `custom_fields` dictionary. The dictionary is only
+    built, and the attribute only set, when at least one such key is present."""
+    if not data.keys() <= standard_keys:
+        target.custom_fields = {
+            key: value for key, value in data.items() if key not in standard_keys
+        }
+
+
+def set_language(target: Any, attribute: str, data: dict, key: str) -> None:
+    """Helper function to save a LegalServer language lookup as the
+    `<attribute>_name` attribute, and its ISO alpha_2 code as `<attribute>` when
+    PyCountry recognizes it."""
+    lookup = data.get(key)
+    if lookup is not None:
+        language_name = lookup.get("lookup_value_name")
+        if language_name is not None:
+            setattr(target, f"{attribute}_name", language_name)
+            language_code = language_code_from_name(language_name)
+            if language_code != "Unknown":
+                setattr(target, attribute, language_code)
+
+
+def copy_fields(
+    target: Any,
+    data: dict,
+    fields: tuple = (),
+    lookup_fields: tuple = (),
+    nested_fields: tuple = (),
+) -> None:
+    """Helper function to copy the fields of a LegalServer record that are
+    present onto an object.
+
+    `fields` are copied as-is under the same name, `lookup_fields` are saved as
+    their `lookup_value_name`, and `nested_fields` are (key, inner key,
+    attribute) tuples for values inside another dictionary.
+
+    The values are plain JSON values, so they are collected first and written to
+    the instance dictionary in one update. DAObject.__setattr__ only does extra
+    work when the value is itself a DAObject, so nothing is skipped."""
+    attributes = {}
+    for key in fields:
+        value = data.get(key)
+        if value is not None:
+            attributes[key] = value
+    for key in lookup_fields:
+        lookup = data.get(key)
+        if lookup is not None:
+            value = lookup.get("lookup_value_name")
+            if value is not None:
+                attributes[key] = value
+    for outer_key, inner_key, attribute in nested_fields:
+        value = (data.get(outer_key) or {}).get(inner_key)
+        if value is not None:
+            attributes[attribute] = value
+    target.__dict__.update(attributes)
+
+
+def populate_records(
+    *,
+    record_list: DAList,
+    source: List[Dict],
+    id_fields: Dict[str, str],
+    fields: tuple = (),
+    lookup_fields: tuple = (),
+    nested_fields: tuple = (),
+    standard_keys: frozenset | None = None,
+) -> int:
+    """Helper function to append a DAObject to `record_list` for each record in
+    `source` and fill it in with `copy_fields`.
+
+    `id_fields` maps attribute names to the keys that are always saved, even
+    when they are empty. When `standard_keys` is given, any other keys are
+    saved with `set_custom_fields`. Returns the number of records populated."""
+    for item in source:
+        new_record = record_list.appendObject()
+        for attribute, key in id_fields.items():
+            setattr(new_record, attribute, item.get(key))
+        copy_fields(new_record, item, fields, lookup_fields, nested_fields)
+        if standard_keys is not None:
+            set_custom_fields(new_record, item, standard_keys)
+        new_record.complete = True
+    return len(source)
+
+
+# Task fields for copy_fields.
+_TASK_FIELDS = (
+    "title",
+    "list_date",
+    "due_date",
+    "active",
+    "deadline",
+    "private",
+    "completed",
+    "completed_date",
+    "is_this_a_case_alert",
+    "statute_of_limitations",
+    "created_date",
+)
+_TASK_LOOKUP_FIELDS = ("task_type", "deadline_type", "program")
+_TASK_NESTED_FIELDS = (
+    ("completed_by", "user_uuid", "completed_by_uuid"),
+    ("completed_by", "user_name", "completed_by_name"),
+    ("dynamic_process", "dynamic_process_id", "dynamic_process_id"),
+    ("dynamic_process", "dynamic_process_uuid", "dynamic_process_uuid"),
+    ("dynamic_process", "dynamic_process_name", "dynamic_process_name"),
+    ("created_by", "user_uuid", "created_by_uuid"),
+    ("created_by", "user_name", "created_by_name"),
+    ("office", "office_name", "office_name"),
+    ("office", "office_code", "office_code"),
+)
 
 
 def populate_tasks(
@@ -1465,6 +1717,10 @@ def populate_tasks(
     legalserver_data from the `get_matter_details` response is not included, it
     makes an API call using the `search_task_data` function.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         task_list (DAList[DAObject]): DAList of DAObjects.
         legalserver_data (dict): Optional dictionary of the matter data from a
@@ -1486,100 +1742,30 @@ def populate_tasks(
 
     if source:
         for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_task = task_list.appendObject()
-                new_task.id = item.get("id")
-                new_task.uuid = item.get("task_uuid")
-                if item.get("title") is not None:
-                    new_task.title = item.get("title")
-                if item.get("list_date") is not None:
-                    new_task.list_date = item.get("list_date")
-                if item.get("due_date") is not None:
-                    new_task.due_date = item.get("due_date")
-                if item.get("active") is not None:
-                    new_task.active = item.get("active")
-                if item.get("task_type") is not None:
-                    if item["task_type"].get("lookup_value_name") is not None:
-                        new_task.task_type = item["task_type"].get("lookup_value_name")
-                if item.get("deadline_type") is not None:
-                    if item["deadline_type"].get("lookup_value_name") is not None:
-                        new_task.deadline_type = item["deadline_type"].get(
-                            "lookup_value_name"
-                        )
-                if item.get("deadline") is not None:
-                    new_task.deadline = item.get("deadline")
-                if item.get("private") is not None:
-                    new_task.private = item.get("private")
-                if item.get("completed") is not None:
-                    new_task.completed = item.get("completed")
-                if item.get("completed_by") is not None:
-                    if item["completed_by"].get("user_uuid") is not None:
-                        new_task.completed_by_uuid = item["completed_by"].get(
-                            "user_uuid"
-                        )
-                    if item["completed_by"].get("user_name") is not None:
-                        new_task.completed_by_name = item["completed_by"].get(
-                            "user_name"
-                        )
-                if item.get("completed_date") is not None:
-                    new_task.completed_date = item.get("completed_date")
-
-                temp_list = []
-                for user in item["users"]:
-                    if user.get("user_uuid") is not None:
-                        temp_list.append(
-                            {
-                                "user_uuid": user.get("user_uuid"),
-                                "user_name": user.get("user_name"),
-                            }
-                        )
-                if temp_list:
-                    new_task.users = temp_list
-                del temp_list
-
-                if item.get("dynamic_process") is not None:
-                    if item["dynamic_process"].get("dynamic_process_id") is not None:
-                        new_task.dynamic_process_id = item["dynamic_process"].get(
-                            "dynamic_process_id"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_uuid") is not None:
-                        new_task.dynamic_process_uuid = item["dynamic_process"].get(
-                            "dynamic_process_uuid"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_name") is not None:
-                        new_task.dynamic_process_name = item["dynamic_process"].get(
-                            "dynamic_process_name"
-                        )
-                if item.get("is_this_a_case_alert") is not None:
-                    new_task.is_this_a_case_alert = item.get("is_this_a_case_alert")
-                if item.get("statute_of_limitations") is not None:
-                    new_task.statute_of_limitations = item.get("statute_of_limitations")
-                if item.get("created_date") is not None:
-                    new_task.created_date = item.get("created_date")
-                if item.get("created_by") is not None:
-                    if item["created_by"].get("user_uuid") is not None:
-                        new_task.created_by_uuid = item["created_by"].get("user_uuid")
-                    if item["created_by"].get("user_name") is not None:
-                        new_task.created_by_name = item["created_by"].get("user_name")
-                if item["program"].get("lookup_value_name") is not None:
-                    new_task.program = item["program"].get("lookup_value_name")
-                if item.get("office") is not None:
-                    if item["office"].get("office_name") is not None:
-                        new_task.office_name = item["office"].get("office_name")
-                    if item["office"].get("office_code") is not None:
-                        new_task.office_code = item["office"].get("office_code")
-
-                standard_key_list = standard_task_keys()
-                custom_fields = {
-                    key: value
-                    for key, value in item.items()
-                    if key not in standard_key_list
+            # item: DAObject = item  # type annotation
+            new_task = task_list.appendObject()
+            new_task.id = item.get("id")
+            new_task.uuid = item.get("task_uuid")
+            copy_fields(
+                new_task,
+                item,
+                _TASK_FIELDS,
+                _TASK_LOOKUP_FIELDS,
+                _TASK_NESTED_FIELDS,
+            )
+            temp_list = [
+                {
+                    "user_uuid": user.get("user_uuid"),
+                    "user_name": user.get("user_name"),
                 }
-                if custom_fields is not None:
-                    new_task.custom_fields = custom_fields
-                del custom_fields
-                new_task.complete = True
+                for user in item["users"]
+                if user.get("user_uuid") is not None
+            ]
+            if temp_list:
+                new_task.users = temp_list
+
+            set_custom_fields(new_task, item, _STANDARD_TASK_KEYS)
+            new_task.complete = True
 
     task_list.gathered = True
     return task_list
@@ -1590,7 +1776,7 @@ def search_event_data(
     legalserver_site: str,
     legalserver_matter_uuid: str | None = None,
     event_search_params: dict | None = None,
-    custom_fields=[],
+    custom_fields: list | None = None,
     sort: str | None = None,
     page_limit: int | None = None,
 ) -> List[Dict]:
@@ -1618,32 +1804,17 @@ def search_event_data(
         Errors are handled in the response. Errors will be present when the
         dictionary response includes a key of 'error'
     """
-    header_content = get_legalserver_token(legalserver_site=legalserver_site)
-    header_content["Content-Type"] = "application/json"
-
-    url = f"https://{legalserver_site}.legalserver.org/api/v2/events"
-    if not event_search_params:
-        event_search_params = {}
-    if legalserver_matter_uuid:
-        event_search_params["matters"] = legalserver_matter_uuid
-    if custom_fields:
-        event_search_params["custom_fields"] = custom_fields
-    if sort == "asc":
-        event_search_params["sort"] = "asc"
-    elif sort == "desc":
-        event_search_params["sort"] = "desc"
-
-    return_data = loop_through_legalserver_responses(
-        url=url,
-        source_type="events",
-        params=event_search_params,
+    return search_legalserver_data(
         legalserver_site=legalserver_site,
-        header_content=header_content,
+        endpoint="events",
+        source_type="events",
+        search_params=event_search_params,
+        filter_params={"matters": legalserver_matter_uuid},
+        custom_fields=custom_fields,
+        sort=sort,
         page_limit=page_limit,
     )
 
-    return return_data
-
 
 def populate_events(
     *,
@@ -1662,6 +1833,10 @@ def populate_events(
     ignores the `outreaches` key in the event response since this is designed to
     connect cases to events and does not currently cover outreaches.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         event_list (DAList[DAObject]): DAList of DAObjects.
         legalserver_data (dict): Optional dictionary of the matter data from a
@@ -1681,100 +1856,94 @@ def populate_events(
         legalserver_site=legalserver_site,
     )
 
-    if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_event = event_list.appendObject()
-                new_event.id = item.get("id")
-                new_event.uuid = item.get("event_uuid")
-                if item.get("title") is not None:
-                    new_event.title = item.get("title")
-                if item.get("location") is not None:
-                    new_event.location = item.get("location")
-                if item.get("front_desk") is not None:
-                    new_event.front_desk = item.get("front_desk")
-                if item.get("broadcast_event") is not None:
-                    new_event.broadcast_event = item.get("broadcast_event")
-                if item.get("court") is not None:
-                    if item["court"].get("organization_name") is not None:
-                        new_event.court_name = item["court"].get("organization_name")
-                    if item["court"].get("organization_uuid") is not None:
-                        new_event.court_uuid = item["court"].get("organization_uuid")
-                if item.get("courtroom") is not None:
-                    new_event.courtroom = item.get("courtroom")
-                if item["event_type"].get("lookup_value_name") is not None:
-                    new_event.event_type = item["event_type"].get("lookup_value_name")
-                if item.get("judge") is not None:
-                    new_event.judge = item.get("judge")
-                if item.get("attendees") is not None:
-                    new_event.attendees = item.get("attendees")
-                if item.get("private_event") is not None:
-                    new_event.private_event = item.get("private_event")
-                temp_list = []
-                for user in item["attendees"]:
-                    if user.get("user_uuid") is not None:
-                        temp_list.append(
-                            {
-                                "user_uuid": user.get("user_uuid"),
-                                "user_name": user.get("user_name"),
-                            }
-                        )
-                if temp_list:
-                    new_event.attendees = temp_list
-                del temp_list
-
-                if item.get("dynamic_process_id") is not None:
-                    if item["dynamic_process_id"].get("dynamic_process_id") is not None:
-                        new_event.dynamic_process_id = item["dynamic_process_id"].get(
-                            "dynamic_process_id"
-                        )
-                    if (
-                        item["dynamic_process_id"].get("dynamic_process_uuid")
-                        is not None
-                    ):
-                        new_event.dynamic_process_uuid = item["dynamic_process_id"].get(
-                            "dynamic_process_uuid"
-                        )
-                    if (
-                        item["dynamic_process_id"].get("dynamic_process_name")
-                        is not None
-                    ):
-                        new_event.dynamic_process_name = item["dynamic_process_id"].get(
-                            "dynamic_process_name"
-                        )
-                # start and end dates of None if not otherwise
-                # if item.get("start_datetime") is not None:
-                new_event.start_datetime = item.get("start_datetime")
-                # if item.get("end_datetime") is not None:
-                new_event.end_datetime = item.get("end_datetime")
-                if item.get("all_day_event") is not None:
-                    new_event.all_day_event = item.get("all_day_event")
-                if item["program"].get("lookup_value_name") is not None:
-                    new_event.program = item["program"].get("lookup_value_name")
-                if item.get("office") is not None:
-                    if item["office"].get("office_name") is not None:
-                        new_event.office_name = item["office"].get("office_name")
-                    if item["office"].get("office_code") is not None:
-                        new_event.office_code = item["office"].get("office_code")
-                if item.get("external_id") is not None:
-                    new_event.external_id = item.get("external_id")
-
-                standard_key_list = standard_event_keys()
-                custom_fields = {
-                    key: value
-                    for key, value in item.items()
-                    if key not in standard_key_list
-                }
-                if custom_fields is not None:
-                    new_event.custom_fields = custom_fields
-                del custom_fields
-                new_event.complete = True
+    if not source:
+        event_list.gathered = True
+        return event_list
+
+    for item in source:
+        # item: DAObject = item  # type annotation
+        new_event = event_list.appendObject()
+        new_event.id = item.get("id")
+        new_event.uuid = item.get("event_uuid")
+        if item.get("title") is not None:
+            new_event.title = item.get("title")
+        if item.get("location") is not None:
+            new_event.location = item.get("location")
+        if item.get("front_desk") is not None:
+            new_event.front_desk = item.get("front_desk")
+        if item.get("broadcast_event") is not None:
+            new_event.broadcast_event = item.get("broadcast_event")
+        court = item.get("court")
+        if court is not None:
+            if court.get("organization_name") is not None:
+                new_event.court_name = court.get("organization_name")
+            if court.get("organization_uuid") is not None:
+                new_event.court_uuid = court.get("organization_uuid")
+        if item.get("courtroom") is not None:
+            new_event.courtroom = item.get("courtroom")
+        set_lookup_value(new_event, "event_type", item, "event_type")
+        if item.get("judge") is not None:
+            new_event.judge = item.get("judge")
+        if item.get("attendees") is not None:
+            new_event.attendees = item.get("attendees")
+        if item.get("private_event") is not None:
+            new_event.private_event = item.get("private_event")
+        temp_list = [
+            {"user_uuid": user.get("user_uuid"), "user_name": user.get("user_name")}
+            for user in item["attendees"]
+            if user.get("user_uuid") is not None
+        ]
+        if temp_list:
+            new_event.attendees = temp_list
+
+        dynamic_process = item.get("dynamic_process_id")
+        if dynamic_process is not None:
+            if dynamic_process.get("dynamic_process_id") is not None:
+                new_event.dynamic_process_id = dynamic_process.get("dynamic_process_id")
+            if dynamic_process.get("dynamic_process_uuid") is not None:
+                new_event.dynamic_process_uuid = dynamic_process.get(
+                    "dynamic_process_uuid"
+                )
+            if dynamic_process.get("dynamic_process_name") is not None:
+                new_event.dynamic_process_name = dynamic_process.get(
+                    "dynamic_process_name"
+                )
+        # start and end dates of None if not otherwise
+        # if item.get("start_datetime") is not None:
+        new_event.start_datetime = item.get("start_datetime")
+        # if item.get("end_datetime") is not None:
+        new_event.end_datetime = item.get("end_datetime")
+        if item.get("all_day_event") is not None:
+            new_event.all_day_event = item.get("all_day_event")
+        set_lookup_value(new_event, "program", item, "program")
+        office = item.get("office")
+        if office is not None:
+            if office.get("office_name") is not None:
+                new_event.office_name = office.get("office_name")
+            if office.get("office_code") is not None:
+                new_event.office_code = office.get("office_code")
+        if item.get("external_id") is not None:
+            new_event.external_id = item.get("external_id")
+
+        set_custom_fields(new_event, item, _STANDARD_EVENT_KEYS)
+        new_event.complete = True
 
     event_list.gathered = True
     return event_list
 
 
+# Income fields for copy_fields. `type` is a lookup and is passed separately.
+_INCOME_FIELDS = (
+    "family_id",
+    "other_family",
+    "amount",
+    "period",
+    "notes",
+    "imported",
+    "exclude",
+)
+
+
 def populate_income(
     *,
     income_list: DAList,
@@ -1811,30 +1980,17 @@ def populate_income(
         legalserver_site=legalserver_site,
     )
 
-    if source:
-        for item in source:
-            # item: DAObject = item # type annotation
-            new_income = income_list.appendObject()
-            new_income.income_uuid = item.get("income_uuid")
-            new_income.id = item.get("id")
-            if item.get("family_id") is not None:
-                new_income.family_id = item.get("family_id")
-            if item.get("other_family") is not None:
-                new_income.other_family = item.get("other_family")
-            if item.get("type") is not None:
-                if item["type"].get("lookup_value_name") is not None:
-                    new_income.type = item["type"].get("lookup_value_name")
-            if item.get("amount") is not None:
-                new_income.amount = item.get("amount")
-            if item.get("period") is not None:
-                new_income.period = item.get("period")
-            if item.get("notes") is not None:
-                new_income.notes = item.get("notes")
-            if item.get("imported") is not None:
-                new_income.imported = item.get("imported")
-            if item.get("exclude") is not None:
-                new_income.exclude = item.get("exclude")
-            new_income.complete = True
+    if not source:
+        income_list.gathered = True
+        return income_list
+
+    for item in source:
+        # item: DAObject = item # type annotation
+        new_income = income_list.appendObject()
+        new_income.income_uuid = item.get("income_uuid")
+        new_income.id = item.get("id")
+        copy_fields(new_income, item, _INCOME_FIELDS, ("type",))
+        new_income.complete = True
 
     income_list.gathered = True
     return income_list
@@ -1888,9 +2044,7 @@ def populate_additional_names(
                 new_name.first = item.get("first")
             if item.get("middle") is not None:
                 new_name.middle = item.get("middle")
-            if item.get("type") is not None:
-                if item["type"].get("lookup_value_name") is not None:
-                    new_name.type = item["type"].get("lookup_value_name")
+            set_lookup_value(new_name, "type", item, "type")
             if item.get("last") is not None:
                 new_name.last = item.get("last")
             if item.get("suffix") is not None:
@@ -1902,6 +2056,53 @@ def populate_additional_names(
     return additional_name_list
 
 
+# Name parts that LegalServer returns for people on a case
+_NAME_FIELDS = ("first", "middle", "last", "suffix")
+
+
+# Adverse Party fields for copy_fields.
+_ADVERSE_PARTY_FIELDS = (
+    "date_of_birth",
+    "approximate_dob",
+    "height",
+    "weight",
+    "eye_color",
+    "hair_color",
+    "drivers_license",
+    "visa_number",
+    "ssn",
+    "phone_home",
+    "phone_home_note",
+    "phone_business",
+    "phone_business_note",
+    "phone_mobile",
+    "phone_mobile_note",
+    "phone_fax",
+    "phone_fax_note",
+    "adverse_party_alert",
+    "adverse_party_note",
+    "active",
+    "email",
+)
+_ADVERSE_PARTY_LOOKUP_FIELDS = (
+    "relationship_type",
+    "race",
+    "immigration_status",
+    "marital_status",
+    "gender",
+)
+# Adverse Party address keys mapped to the attribute on the Address
+_ADVERSE_PARTY_ADDRESS_FIELDS = {
+    "street_address": "address",
+    "apt_num": "unit",
+    "street_address_2": "street_2",
+    "addr2": "addr2",
+    "city": "city",
+    "state": "state",
+    "zip_code": "zip",
+}
+
+
 def populate_adverse_parties(
     *,
     adverse_party_list: DAList,
@@ -1919,6 +2120,10 @@ def populate_adverse_parties(
     Since the standard response from the `get_matter_details` does not always
     include this data, it will always make that call.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         adverse_party_list (DAList[Person]): required DAList of
             Persons for the Adverse Parties.
@@ -1947,137 +2152,40 @@ def populate_adverse_parties(
             new_ap.uuid = item.get("uuid")
             new_ap.id = item.get("id")
             if item.get("organization_name") is None:
-                new_ap.initializeAttribute("name", IndividualName)
-                if item.get("first") is not None:
-                    new_ap.name.first = item.get("first")
-                if item.get("middle") is not None:
-                    new_ap.name.middle = item.get("middle")
-                if item.get("last") is not None:
-                    new_ap.name.last = item.get("last")
-                if item.get("suffix") is not None:
-                    new_ap.name.suffix = item.get("suffix")
+                copy_fields(new_ap.name, item, _NAME_FIELDS)
             else:
                 new_ap.name = item.get("organization_name")
-            if item.get("business_type") is not None:
-                if item.get("business_type").get("lookup_value_name") is not None:
-                    new_ap.business_type = item["business_type"].get(
-                        "lookup_value_name"
-                    )
-            if item.get("date_of_birth") is not None:
-                new_ap.date_of_birth = item.get("date_of_birth")
-            if item.get("approximate_dob") is not None:
-                new_ap.approximate_dob = item.get("approximate_dob")
-            if item.get("relationship_type") is not None:
-                if item["relationship_type"].get("lookup_value_name") is not None:
-                    new_ap.relationship_type = item["relationship_type"].get(
-                        "lookup_value_name"
-                    )
-            if item.get("language") is not None:
-                if item["language"].get("lookup_value_name") is not None:
-                    new_ap.language_name = item["language"].get("lookup_value_name")
-                    if (
-                        language_code_from_name(
-                            item["language"].get("lookup_value_name")
-                        )
-                        != "Unknown"
-                    ):
-                        new_ap.language = language_code_from_name(
-                            item["language"].get("lookup_value_name")
-                        )
-            if item.get("height") is not None:
-                new_ap.height = item.get("height")
-            if item.get("weight") is not None:
-                new_ap.weight = item.get("weight")
-            if item.get("eye_color") is not None:
-                new_ap.eye_color = item.get("eye_color")
-            if item.get("hair_color") is not None:
-                new_ap.hair_color = item.get("hair_color")
-            if item.get("race") is not None:
-                if item["race"].get("lookup_value_name") is not None:
-                    new_ap.race = item["race"].get("lookup_value_name")
-            if item.get("drivers_license") is not None:
-                new_ap.drivers_license = item.get("drivers_license")
-            if item.get("visa_number") is not None:
-                new_ap.visa_number = item.get("visa_number")
-            if item.get("immigration_status") is not None:
-                if item["immigration_status"].get("lookup_value_name") is not None:
-                    new_ap.immigration_status = item["immigration_status"].get(
-                        "lookup_value_name"
-                    )
-            if item.get("marital_status") is not None:
-                if item["marital_status"].get("lookup_value_name") is not None:
-                    new_ap.marital_status = item["marital_status"].get(
-                        "lookup_value_name"
-                    )
-            if item.get("gender") is not None:
-                if item["gender"].get("lookup_value_name") is not None:
-                    new_ap.gender = item["gender"].get("lookup_value_name")
-            if item.get("ssn") is not None:
-                new_ap.ssn = item.get("ssn")
-            if item.get("government_generated_id") is not None:
-                # this is a list in the response, but it is not a list of lookups.
-                if len(item.get("government_generated_id")) > 0:
-                    new_ap.government_generated_id = item.get("government_generated_id")
-            if item.get("street_address") is not None:
-                new_ap.address.address = item.get("street_address")
-            if item.get("apt_num") is not None:
-                new_ap.address.unit = item.get("apt_num")
-            if item.get("street_address_2") is not None:
-                new_ap.address.street_2 = item.get("street_address_2")
-            if item.get("addr2") is not None:
-                new_ap.address.addr2 = item.get("addr2")
-            if item.get("city") is not None:
-                new_ap.address.city = item.get("city")
-            if item.get("state") is not None:
-                new_ap.address.state = item.get("state")
-            if item.get("zip_code") is not None:
-                new_ap.address.zip = item.get("zip_code")
-            if item.get("county") is not None:
-                if item["county"].get("lookup_value_name") is not None:
-                    new_ap.address.county = item["county"].get("lookup_value_name")
-                    new_ap.address.county_uuid = item["county"].get("lookup_value_uuid")
-                    if item["county"].get("lookup_value_state") is not None:
-                        new_ap.address.county_state = item["county"].get(
-                            "lookup_value_state"
-                        )
-                    if item["county"].get("lookup_value_FIPS") is not None:
-                        new_ap.address.county_FIPS = item["county"].get(
-                            "lookup_value_FIPS"
-                        )
-            if item.get("phone_home") is not None:
-                new_ap.phone_home = item.get("phone_home")
-            if item.get("phone_home_note") is not None:
-                new_ap.phone_home_note = item.get("phone_home_note")
-            if item.get("phone_business") is not None:
-                new_ap.phone_business = item.get("phone_business")
-            if item.get("phone_business_note") is not None:
-                new_ap.phone_business_note = item.get("phone_business_note")
-            if item.get("phone_mobile") is not None:
-                new_ap.phone_mobile = item.get("phone_mobile")
-            if item.get("phone_mobile_note") is not None:
-                new_ap.phone_mobile_note = item.get("phone_mobile_note")
-            if item.get("phone_fax") is not None:
-                new_ap.phone_fax = item.get("phone_fax")
-            if item.get("phone_fax_note") is not None:
-                new_ap.phone_fax_note = item.get("phone_fax_note")
-            if item.get("adverse_party_alert") is not None:
-                new_ap.adverse_party_alert = item.get("adverse_party_alert")
-            if item.get("adverse_party_note") is not None:
-                new_ap.adverse_party_note = item.get("adverse_party_note")
-            if item.get("active") is not None:
-                new_ap.active = item.get("active")
-            if item.get("email") is not None:
-                new_ap.email = item.get("email")
-
-            standard_key_list = standard_adverse_party_keys()
-            custom_fields = {
-                key: value
-                for key, value in item.items()
-                if key not in standard_key_list
-            }
-            if custom_fields is not None:
-                new_ap.custom_fields = custom_fields
-            del custom_fields
+            copy_fields(
+                new_ap,
+                item,
+                _ADVERSE_PARTY_FIELDS,
+                _ADVERSE_PARTY_LOOKUP_FIELDS,
+            )
+            set_lookup_value(new_ap, "business_type", item, "business_type")
+            set_language(new_ap, "language", item, "language")
+            # this is a list in the response, but it is not a list of lookups.
+            government_generated_id = item.get("government_generated_id")
+            if government_generated_id:
+                new_ap.government_generated_id = government_generated_id
+            address = new_ap.address
+            for key, attribute in _ADVERSE_PARTY_ADDRESS_FIELDS.items():
+                value = item.get(key)
+                if value is not None:
+                    setattr(address, attribute, value)
+            county = item.get("county")
+            if county is not None:
+                county_name = county.get("lookup_value_name")
+                if county_name is not None:
+                    address.county = county_name
+                    address.county_uuid = county.get("lookup_value_uuid")
+                    county_state = county.get("lookup_value_state")
+                    if county_state is not None:
+                        address.county_state = county_state
+                    county_fips = county.get("lookup_value_FIPS")
+                    if county_fips is not None:
+                        address.county_FIPS = county_fips
+
+            set_custom_fields(new_ap, item, _STANDARD_ADVERSE_PARTY_KEYS)
 
             new_ap.complete = True
 
@@ -2085,6 +2193,50 @@ def populate_adverse_parties(
     return adverse_party_list
 
 
+# Non-Adverse Party fields for copy_fields.
+_NON_ADVERSE_PARTY_FIELDS = (
+    "date_of_birth",
+    "approximate_dob",
+    "ssn",
+    "veteran",
+    "disabled",
+    "visa_number",
+    "phone_home",
+    "phone_home_note",
+    "phone_business",
+    "phone_business_note",
+    "phone_mobile",
+    "phone_mobile_note",
+    "phone_fax",
+    "phone_fax_note",
+    "family_member",
+    "household_member",
+    "potential_conflict",
+    "non_adverse_party",
+    "active",
+    "email",
+)
+_NON_ADVERSE_PARTY_LOOKUP_FIELDS = (
+    "relationship_type",
+    "gender",
+    "race",
+    "hud_race",
+    "hud_disabling_condition",
+    "immigration_status",
+    "citizenship_status",
+    "marital_status",
+)
+# Non-Adverse Party address keys mapped to the attribute on the Address
+_NON_ADVERSE_PARTY_ADDRESS_FIELDS = {
+    "street_address": "address",
+    "apt_num": "unit",
+    "addr2": "addr2",
+    "city": "city",
+    "state": "state",
+    "zip_code": "zip",
+}
+
+
 def populate_non_adverse_parties(
     *,
     non_adverse_party_list: DAList,
@@ -2102,6 +2254,10 @@ def populate_non_adverse_parties(
     function. Since the standard response from the `get_matter_details` does not
     always include this data, it will always make that call.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         non_adverse_party_list (DAList[Individual]): required DAList of
             Individuals for the Non-Adverse Parties.
@@ -2123,157 +2279,84 @@ def populate_non_adverse_parties(
         legalserver_site=legalserver_site,
     )
 
-    if source:
-        for item in source:
-            # item: DAObject = item # type annotation
-            new_nap = non_adverse_party_list.appendObject(Individual)
-            new_nap.uuid = item.get("uuid")
-            new_nap.id = item.get("id")
-            if item.get("organization_name") is None:
-                new_nap.initializeAttribute("name", Individual)
-                if item.get("first") is not None:
-                    new_nap.name.first = item.get("first")
-                if item.get("middle") is not None:
-                    new_nap.name.middle = item.get("middle")
-                if item.get("last") is not None:
-                    new_nap.name.last = item.get("last")
-                if item.get("suffix") is not None:
-                    new_nap.name.suffix = item.get("suffix")
-            else:
-                new_nap.name = item.get("organization_name")
-            if item.get("date_of_birth") is not None:
-                new_nap.date_of_birth = item.get("date_of_birth")
-            if item.get("approximate_dob") is not None:
-                new_nap.approximate_dob = item.get("approximate_dob")
-            if item["relationship_type"].get("lookup_value_name") is not None:
-                new_nap.relationship_type = item["relationship_type"].get(
-                    "lookup_value_name"
-                )
-            if item["language"].get("lookup_value_name") is not None:
-                new_nap.language_name = item["language"].get("lookup_value_name")
-                if (
-                    language_code_from_name(item["language"].get("lookup_value_name"))
-                    != "Unknown"
-                ):
-                    new_nap.language = language_code_from_name(
-                        item["language"].get("lookup_value_name")
-                    )
-            if item.get("gender") is not None:
-                if item["gender"].get("lookup_value_name") is not None:
-                    new_nap.gender = item["gender"].get("lookup_value_name")
-            if item.get("ssn") is not None:
-                new_nap.ssn = item.get("ssn")
-            if item.get("country_of_birth") is not None:
-                ## TODO country codes
-                if item["country_of_birth"].get("lookup_value_name") is not None:
-                    new_nap.country_of_birth_name = item["country_of_birth"].get(
-                        "lookup_value_name"
-                    )
-            if item["race"].get("lookup_value_name") is not None:
-                new_nap.race = item["race"].get("lookup_value_name")
-            if item.get("veteran") is not None:
-                new_nap.veteran = item.get("veteran")
-            if item.get("disabled") is not None:
-                new_nap.disabled = item.get("disabled")
-            if item.get("hud_race") is not None:
-                if item["hud_race"].get("lookup_value_name") is not None:
-                    new_nap.hud_race = item["hud_race"].get("lookup_value_name")
-            if item.get("hud_9902_ethnicity") is not None:
-                if item["hud_9902_ethnicity"].get("hud_9902_ethnicity") is not None:
-                    new_nap.hud_9902_ethnicity = item["hud_9902_ethnicity"].get(
-                        "lookup_value_name"
-                    )
-            if item.get("hud_disabling_condition") is not None:
-                if item["hud_disabling_condition"].get("lookup_value_name") is not None:
-                    new_nap.hud_disabling_condition = item[
-                        "hud_disabling_condition"
-                    ].get("lookup_value_name")
-            if item.get("visa_number") is not None:
-                new_nap.visa_number = item.get("visa_number")
-            if item["immigration_status"].get("lookup_value_name") is not None:
-                new_nap.immigration_status = item["immigration_status"].get(
-                    "lookup_value_name"
-                )
-            if item["citizenship_status"].get("lookup_value_name") is not None:
-                new_nap.citizenship_status = item["citizenship_status"].get(
+    if not source:
+        non_adverse_party_list.gathered = True
+        return non_adverse_party_list
+
+    for item in source:
+        # item: DAObject = item # type annotation
+        new_nap = non_adverse_party_list.appendObject(Individual)
+        new_nap.uuid = item.get("uuid")
+        new_nap.id = item.get("id")
+        if item.get("organization_name") is None:
+            copy_fields(new_nap.name, item, _NAME_FIELDS)
+        else:
+            new_nap.name = item.get("organization_name")
+        copy_fields(
+            new_nap,
+            item,
+            _NON_ADVERSE_PARTY_FIELDS,
+            _NON_ADVERSE_PARTY_LOOKUP_FIELDS,
+        )
+        set_language(new_nap, "language", item, "language")
+        ## TODO country codes
+        set_lookup_value(new_nap, "country_of_birth_name", item, "country_of_birth")
+        if item.get("hud_9902_ethnicity") is not None:
+            if item["hud_9902_ethnicity"].get("hud_9902_ethnicity") is not None:
+                new_nap.hud_9902_ethnicity = item["hud_9902_ethnicity"].get(
                     "lookup_value_name"
                 )
-            if item["marital_status"].get("lookup_value_name") is not None:
-                new_nap.marital_status = item["marital_status"].get("lookup_value_name")
-            if item.get("government_generated_id") is not None:
-                # this is a list in the response, but it is not a list of lookups.
-                if len(item.get("government_generated_id")) > 0:
-                    new_nap.government_generated_id = item.get(
-                        "government_generated_id"
-                    )
-            if item.get("street_address") is not None:
-                new_nap.address.address = item.get("street_address")
-            if item.get("apt_num") is not None:
-                new_nap.address.unit = item.get("apt_num")
-            if item.get("addr2") is not None:
-                new_nap.address.addr2 = item.get("addr2")
-            if item.get("city") is not None:
-                new_nap.address.city = item.get("city")
-            if item.get("state") is not None:
-                new_nap.address.state = item.get("state")
-            if item.get("zip_code") is not None:
-                new_nap.address.zip = item.get("zip_code")
-            if item["county"].get("lookup_value_name") is not None:
-                new_nap.address.county = item["county"].get("lookup_value_name")
-                new_nap.address.county_uuid = item["county"].get("lookup_value_uuid")
-                if item["county"].get("lookup_value_state") is not None:
-                    new_nap.address.county_state = item["county"].get(
-                        "lookup_value_state"
-                    )
-                if item["county"].get("lookup_value_FIPS") is not None:
-                    new_nap.address.county_FIPS = item["county"].get(
-                        "lookup_value_FIPS"
-                    )
-            if item.get("phone_home") is not None:
-                new_nap.phone_home = item.get("phone_home")
-            if item.get("phone_home_note") is not None:
-                new_nap.phone_home_note = item.get("phone_home_note")
-            if item.get("phone_business") is not None:
-                new_nap.phone_business = item.get("phone_business")
-            if item.get("phone_business_note") is not None:
-                new_nap.phone_business_note = item.get("phone_business_note")
-            if item.get("phone_mobile") is not None:
-                new_nap.phone_mobile = item.get("phone_mobile")
-            if item.get("phone_mobile_note") is not None:
-                new_nap.phone_mobile_note = item.get("phone_mobile_note")
-            if item.get("phone_fax") is not None:
-                new_nap.phone_fax = item.get("phone_fax")
-            if item.get("phone_fax_note") is not None:
-                new_nap.phone_fax_note = item.get("phone_fax_note")
-            if item.get("family_member") is not None:
-                new_nap.family_member = item.get("family_member")
-            if item.get("household_member") is not None:
-                new_nap.household_member = item.get("household_member")
-            if item.get("potential_conflict") is not None:
-                new_nap.potential_conflict = item.get("potential_conflict")
-            if item.get("non_adverse_party") is not None:
-                new_nap.non_adverse_party = item.get("non_adverse_party")
-            if item.get("active") is not None:
-                new_nap.active = item.get("active")
-            if item.get("email") is not None:
-                new_nap.email = item.get("email")
-
-            standard_key_list = standard_non_adverse_party_keys()
-            custom_fields = {
-                key: value
-                for key, value in item.items()
-                if key not in standard_key_list
-            }
-            if custom_fields is not None:
-                new_nap.custom_fields = custom_fields
-            del custom_fields
-
-            new_nap.complete = True
+        # this is a list in the response, but it is not a list of lookups.
+        government_generated_id = item.get("government_generated_id")
+        if government_generated_id:
+            new_nap.government_generated_id = government_generated_id
+        address = new_nap.address
+        for key, attribute in _NON_ADVERSE_PARTY_ADDRESS_FIELDS.items():
+            value = item.get(key)
+            if value is not None:
+                setattr(address, attribute, value)
+        county = item["county"]
+        county_name = county.get("lookup_value_name")
+        if county_name is not None:
+            address.county = county_name
+            address.county_uuid = county.get("lookup_value_uuid")
+            county_state = county.get("lookup_value_state")
+            if county_state is not None:
+                address.county_state = county_state
+            county_fips = county.get("lookup_value_FIPS")
+            if county_fips is not None:
+                address.county_FIPS = county_fips
+
+        set_custom_fields(new_nap, item, _STANDARD_NON_ADVERSE_PARTY_KEYS)
+
+        new_nap.complete = True
 
     non_adverse_party_list.gathered = True
     return non_adverse_party_list
 
 
+# Note fields for copy_fields.
+_NOTE_FIELDS = (
+    "subject",
+    "body",
+    "date_posted",
+    "date_time_created",
+    "last_update",
+    "allow_etransfer",
+    "active",
+    "note_was_emailed",
+    "note_was_messaged",
+    "note_has_document_attached",
+)
+_NOTE_LOOKUP_FIELDS = ("note_type",)
+_NOTE_NESTED_FIELDS = (
+    ("created_by", "user_uuid", "created_by_uuid"),
+    ("created_by", "user_name", "created_by_name"),
+    ("last_updated_by", "user_uuid", "last_updated_by_uuid"),
+    ("last_updated_by", "user_name", "last_updated_by_name"),
+)
+
+
 def populate_notes(
     *,
     note_list: DAList,
@@ -2309,51 +2392,14 @@ def populate_notes(
         legalserver_site=legalserver_site,
     )
     if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_note = note_list.appendObject()
-                new_note.casenote_uuid = item.get("casenote_uuid")
-                new_note.id = item.get("id")
-                if item.get("subject") is not None:
-                    new_note.subject = item.get("subject")
-                if item.get("body") is not None:
-                    new_note.body = item.get("body")
-                if item["note_type"].get("lookup_value_name") is not None:
-                    new_note.note_type = item["note_type"].get("lookup_value_name")
-                if item.get("date_posted") is not None:
-                    new_note.date_posted = item.get("date_posted")
-                if item.get("date_time_created") is not None:
-                    new_note.date_time_created = item.get("date_time_created")
-                if item.get("last_update") is not None:
-                    new_note.last_update = item.get("last_update")
-                if item.get("allow_etransfer") is not None:
-                    new_note.allow_etransfer = item.get("allow_etransfer")
-                if item.get("active") is not None:
-                    new_note.active = item.get("active")
-                if item.get("note_was_emailed") is not None:
-                    new_note.note_was_emailed = item.get("note_was_emailed")
-                if item.get("note_was_messaged") is not None:
-                    new_note.note_was_messaged = item.get("note_was_messaged")
-                if item.get("note_has_document_attached") is not None:
-                    new_note.note_has_document_attached = item.get(
-                        "note_has_document_attached"
-                    )
-                if item.get("created_by") is not None:
-                    if item["created_by"].get("user_uuid") is not None:
-                        new_note.created_by_uuid = item["created_by"].get("user_uuid")
-                    if item["created_by"].get("user_name") is not None:
-                        new_note.created_by_name = item["created_by"].get("user_name")
-                if item.get("last_updated_by") is not None:
-                    if item["last_updated_by"].get("user_uuid") is not None:
-                        new_note.last_updated_by_uuid = item["last_updated_by"].get(
-                            "user_uuid"
-                        )
-                    if item["last_updated_by"].get("user_name") is not None:
-                        new_note.last_updated_by_name = item["last_updated_by"].get(
-                            "user_name"
-                        )
-                new_note.complete = True
+        populate_records(
+            record_list=note_list,
+            source=source,
+            id_fields={"casenote_uuid": "casenote_uuid", "id": "id"},
+            fields=_NOTE_FIELDS,
+            lookup_fields=_NOTE_LOOKUP_FIELDS,
+            nested_fields=_NOTE_NESTED_FIELDS,
+        )
     note_list.gathered = True
     return note_list
 
@@ -2396,49 +2442,81 @@ def populate_assignments(
 
     if source:
         for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_assignment = assignment_list.appendObject()
-                new_assignment.uuid = item.get("uuid")
-                new_assignment.id = item.get("id")
-                new_assignment.type = item["type"].get("lookup_value_name")
-                new_assignment.start_date = item.get("start_date")
-                new_assignment.end_date = item.get("end_date")
-                if item.get("date_requested") is not None:
-                    new_assignment.date_requested = item.get("date_requested")
-                if item.get("confirmed") is not None:
-                    new_assignment.confirmed = item.get("confirmed")
-                new_assignment.program = item["program"].get("lookup_value_name")
-                if item.get("notes") is not None:
-                    new_assignment.notes = item.get("notes")
-                if item.get("created_at") is not None:
-                    new_assignment.created_at = item.get("created_at")
-                if item.get("satisfies_outreach_training_credit") is not None:
-                    new_assignment.satisfies_outreach_training_credit = item.get(
-                        "satisfies_outreach_training_credit"
+            # item: DAObject = item  # type annotation
+            new_assignment = assignment_list.appendObject()
+            new_assignment.uuid = item.get("uuid")
+            new_assignment.id = item.get("id")
+            new_assignment.type = item["type"].get("lookup_value_name")
+            new_assignment.start_date = item.get("start_date")
+            new_assignment.end_date = item.get("end_date")
+            if item.get("date_requested") is not None:
+                new_assignment.date_requested = item.get("date_requested")
+            if item.get("confirmed") is not None:
+                new_assignment.confirmed = item.get("confirmed")
+            new_assignment.program = item["program"].get("lookup_value_name")
+            if item.get("notes") is not None:
+                new_assignment.notes = item.get("notes")
+            if item.get("created_at") is not None:
+                new_assignment.created_at = item.get("created_at")
+            if item.get("satisfies_outreach_training_credit") is not None:
+                new_assignment.satisfies_outreach_training_credit = item.get(
+                    "satisfies_outreach_training_credit"
+                )
+            if item.get("office") is not None:
+                if item["office"].get("office_name") is not None:
+                    new_assignment.office_name = item["office"].get("office_name")
+                if item["office"].get("office_code") is not None:
+                    new_assignment.office_code = item["office"].get("office_code")
+            new_assignment.user_uuid = item["user"].get("user_uuid")
+            new_assignment.user_name = item["user"].get("user_name")
+            if item.get("assigned_by") is not None:
+                if item["assigned_by"].get("user_uuid") is not None:
+                    new_assignment.assigned_by_uuid = item["assigned_by"].get(
+                        "user_uuid"
+                    )
+                if item["assigned_by"].get("user_name") is not None:
+                    new_assignment.assigned_by_name = item["assigned_by"].get(
+                        "user_name"
                     )
-                if item.get("office") is not None:
-                    if item["office"].get("office_name") is not None:
-                        new_assignment.office_name = item["office"].get("office_name")
-                    if item["office"].get("office_code") is not None:
-                        new_assignment.office_code = item["office"].get("office_code")
-                new_assignment.user_uuid = item["user"].get("user_uuid")
-                new_assignment.user_name = item["user"].get("user_name")
-                if item.get("assigned_by") is not None:
-                    if item["assigned_by"].get("user_uuid") is not None:
-                        new_assignment.assigned_by_uuid = item["assigned_by"].get(
-                            "user_uuid"
-                        )
-                    if item["assigned_by"].get("user_name") is not None:
-                        new_assignment.assigned_by_name = item["assigned_by"].get(
-                            "user_name"
-                        )
-                new_assignment.complete = True
+            new_assignment.complete = True
 
     assignment_list.gathered = True
     return assignment_list
 
 
+# Litigation keys that are copied as-is when they are present.
+_LITIGATION_FIELDS = (
+    "court_text",
+    "court_number",
+    "caption",
+    "docket",
+    "cause_of_action",
+    "judge",
+    "adverse_party",
+    "notes",
+    "outcome",
+    "outcome_date",
+    "default_date",
+    "date_served",
+    "date_proceeding_initiated",
+    "date_proceeding_concluded",
+    "application_filing_date",
+    "court_calendar",
+    "lsc_disclosure_required",
+    "number_of_people_served",
+    "external_id",
+)
+_LITIGATION_LOOKUP_FIELDS = ("litigation_relationship", "filing_type")
+# Litigation values nested in another dictionary as (key, inner key, attribute).
+_LITIGATION_NESTED_FIELDS = (
+    ("court_id", "organization_name", "court_name"),
+    ("court_id", "organization_uuid", "court_uuid"),
+    ("dynamic_process", "dynamic_process_id", "dynamic_process_id"),
+    ("dynamic_process", "dynamic_process_uuid", "dynamic_process_uuid"),
+    ("dynamic_process", "dynamic_process_name", "dynamic_process_name"),
+)
+
+
 def populate_litigations(
     *,
     litigation_list: DAList,
@@ -2454,6 +2532,10 @@ def populate_litigations(
     legalserver_data from the `get_matter_details` response is not included, it will
     make an API call using the `search_matter_litigation_data` function.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         litigation_list (DAList[DAObject]): DAList of DAObjects.
         legalserver_data (dict): Optional dictionary of the matter data from a
@@ -2475,109 +2557,33 @@ def populate_litigations(
         legalserver_matter_uuid=legalserver_matter_uuid,
         legalserver_site=legalserver_site,
     )
-    if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_litigation = litigation_list.appendObject()
-                if item.get("litigation_uuid") is not None:
-                    new_litigation.litigation_uuid = item.get("litigation_uuid")
-                else:
-                    new_litigation.litigation_uuid = item.get("uuid")
-                if item.get("litigation_id") is not None:
-                    new_litigation.litigation_id = item.get("litigation_id")
-                else:
-                    new_litigation.litigation_id = item.get("id")
-                if item.get("court_text") is not None:
-                    new_litigation.court_text = item.get("court_text")
-                if item.get("court_id") is not None:
-                    if item["court_id"].get("organization_name") is not None:
-                        new_litigation.court_name = item["court_id"].get(
-                            "organization_name"
-                        )
-                    if item["court_id"].get("organization_uuid") is not None:
-                        new_litigation.court_uuid = item["court_id"].get(
-                            "organization_uuid"
-                        )
-                if item.get("court_number") is not None:
-                    new_litigation.court_number = item.get("court_number")
-                if item.get("caption") is not None:
-                    new_litigation.caption = item.get("caption")
-                if item.get("docket") is not None:
-                    new_litigation.docket = item.get("docket")
-                if item.get("cause_of_action") is not None:
-                    new_litigation.cause_of_action = item.get("cause_of_action")
-                if item.get("judge") is not None:
-                    new_litigation.judge = item.get("judge")
-                if item.get("adverse_party") is not None:
-                    new_litigation.adverse_party = item.get("adverse_party")
-                if item.get("notes") is not None:
-                    new_litigation.notes = item.get("notes")
-                if item.get("outcome") is not None:
-                    new_litigation.outcome = item.get("outcome")
-                if item.get("outcome_date") is not None:
-                    new_litigation.outcome_date = item.get("outcome_date")
-                if item.get("default_date") is not None:
-                    new_litigation.default_date = item.get("default_date")
-                if item.get("date_served") is not None:
-                    new_litigation.date_served = item.get("date_served")
-                if item.get("date_proceeding_initiated") is not None:
-                    new_litigation.date_proceeding_initiated = item.get(
-                        "date_proceeding_initiated"
-                    )
-                if item.get("date_proceeding_concluded") is not None:
-                    new_litigation.date_proceeding_concluded = item.get(
-                        "date_proceeding_concluded"
-                    )
-                if item.get("dynamic_process") is not None:
-                    if item["dynamic_process"].get("dynamic_process_id") is not None:
-                        new_litigation.dynamic_process_id = item["dynamic_process"].get(
-                            "dynamic_process_id"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_uuid") is not None:
-                        new_litigation.dynamic_process_uuid = item[
-                            "dynamic_process"
-                        ].get("dynamic_process_uuid")
-                    if item["dynamic_process"].get("dynamic_process_name") is not None:
-                        new_litigation.dynamic_process_name = item[
-                            "dynamic_process"
-                        ].get("dynamic_process_name")
-                if item.get("application_filing_date") is not None:
-                    new_litigation.application_filing_date = item.get(
-                        "application_filing_date"
-                    )
-                if item.get("court_calendar") is not None:
-                    new_litigation.court_calendar = item.get("court_calendar")
-                if item.get("lsc_disclosure_required") is not None:
-                    new_litigation.lsc_disclosure_required = item.get(
-                        "lsc_disclosure_required"
-                    )
-                if item["litigation_relationship"].get("lookup_value_name") is not None:
-                    new_litigation.litigation_relationship = item[
-                        "litigation_relationship"
-                    ].get("lookup_value_name")
-                if item["filing_type"].get("lookup_value_name") is not None:
-                    new_litigation.filing_type = item["filing_type"].get(
-                        "lookup_value_name"
-                    )
-                if item.get("number_of_people_served") is not None:
-                    new_litigation.number_of_people_served = item.get(
-                        "number_of_people_served"
-                    )
-                if item.get("external_id") is not None:
-                    new_litigation.external_id = item.get("external_id")
-
-                standard_key_list = standard_litigation_keys()
-                custom_fields = {
-                    key: value
-                    for key, value in item.items()
-                    if key not in standard_key_list
-                }
-                if custom_fields is not None:
-                    new_litigation.custom_fields = custom_fields
-                del custom_fields
-                new_litigation.complete = True
-        log(f"Litigations Populated for a case.")
+    if not source:
+        litigation_list.gathered = True
+        return litigation_list
+
+    populated_count = 0
+    for item in source:
+        # item: DAObject = item  # type annotation
+        new_litigation = litigation_list.appendObject()
+        if item.get("litigation_uuid") is not None:
+            new_litigation.litigation_uuid = item.get("litigation_uuid")
+        else:
+            new_litigation.litigation_uuid = item.get("uuid")
+        if item.get("litigation_id") is not None:
+            new_litigation.litigation_id = item.get("litigation_id")
+        else:
+            new_litigation.litigation_id = item.get("id")
+        copy_fields(
+            new_litigation,
+            item,
+            _LITIGATION_FIELDS,
+            _LITIGATION_LOOKUP_FIELDS,
+            _LITIGATION_NESTED_FIELDS,
+        )
+        set_custom_fields(new_litigation, item, _STANDARD_LITIGATION_KEYS)
+        new_litigation.complete = True
+        populated_count += 1
+    log(f"{populated_count} Litigations Populated for a case.")
     litigation_list.gathered = True
     return litigation_list
 
@@ -2625,6 +2631,11 @@ def standard_litigation_keys() -> List[str]:
     return standard_litigation_keys
 
 
+# The populate functions check record keys against frozenset copies of the
+# standard key lists, so each check is a hash lookup instead of a list scan.
+_STANDARD_LITIGATION_KEYS = frozenset(standard_litigation_keys())
+
+
 def standard_charges_keys() -> List[str]:
     """Return the list of keys present in a Matter Charge response from
     LegalServer to better identify the custom fields.
@@ -2661,6 +2672,9 @@ def standard_charges_keys() -> List[str]:
     return standard_charges_keys
 
 
+_STANDARD_CHARGES_KEYS = frozenset(standard_charges_keys())
+
+
 def standard_services_keys() -> List[str]:
     """Return the list of keys present in a Matter Services response from
     LegalServer to better identify the custom fields.
@@ -2694,6 +2708,9 @@ def standard_services_keys() -> List[str]:
     return standard_services_keys
 
 
+_STANDARD_SERVICES_KEYS = frozenset(standard_services_keys())
+
+
 def standard_user_keys() -> List[str]:
     """Return the list of keys present in an User response from LegalServer to
     better identify the custom fields.
@@ -2757,6 +2774,9 @@ def standard_user_keys() -> List[str]:
     return standard_user_keys
 
 
+_STANDARD_USER_KEYS = frozenset(standard_user_keys())
+
+
 def standard_organization_affiliation_keys() -> List[str]:
     """Return the list of keys present in an User's Organization Affiliation response from LegalServer to
     better identify the fields.
@@ -2851,6 +2871,9 @@ def standard_client_home_address_keys() -> List[str]:
     return standard_client_home_address_keys
 
 
+_STANDARD_CLIENT_HOME_ADDRESS_KEYS = frozenset(standard_client_home_address_keys())
+
+
 def standard_contact_keys() -> List[str]:
     """Return the list of keys present in a Contact response from LegalServer to
     better identify the custom fields.
@@ -2937,6 +2960,9 @@ def standard_event_keys() -> List[str]:
     return standard_event_keys
 
 
+_STANDARD_EVENT_KEYS = frozenset(standard_event_keys())
+
+
 def standard_non_adverse_party_keys() -> List[str]:
     """Return the list of keys present in a Non-Adverse Party List response from
     LegalServer to better identify the custom fields.
@@ -2999,6 +3025,9 @@ def standard_non_adverse_party_keys() -> List[str]:
     return standard_non_adverse_party_keys
 
 
+_STANDARD_NON_ADVERSE_PARTY_KEYS = frozenset(standard_non_adverse_party_keys())
+
+
 def standard_adverse_party_keys() -> List[str]:
     """Return the list of keys present in an Adverse Party List response from
     LegalServer to better identify the custom fields.
@@ -3060,6 +3089,9 @@ def standard_adverse_party_keys() -> List[str]:
     return standard_adverse_party_keys
 
 
+_STANDARD_ADVERSE_PARTY_KEYS = frozenset(standard_adverse_party_keys())
+
+
 def standard_task_keys() -> List[str]:
     """Return the list of keys present in a Task response from LegalServer to
     better identify the custom fields.
@@ -3097,6 +3129,9 @@ def standard_task_keys() -> List[str]:
     return standard_task_keys
 
 
+_STANDARD_TASK_KEYS = frozenset(standard_task_keys())
+
+
 def standard_matter_keys() -> List[str]:
     """Return the list of keys present in a Matter response from LegalServer to
     better identify the custom fields.
@@ -3276,6 +3311,9 @@ def standard_matter_keys() -> List[str]:
     return standard_matter_keys
 
 
+_STANDARD_MATTER_KEYS = frozenset(standard_matter_keys())
+
+
 def standard_document_keys() -> List[str]:
     """Return the list of keys present in a Document response from LegalServer to
     better identify the custom fields.
@@ -3308,6 +3346,42 @@ def standard_document_keys() -> List[str]:
     return standard_document_keys
 
 
+# Document fields for copy_fields.
+_DOCUMENT_FIELDS = (
+    "name",
+    "title",
+    "mime_type",
+    "virus_free",
+    "date_create",
+    "download_url",
+    "virus_scanned",
+    "disk_file_size",
+    "folder",
+    "funding_code",
+    "hyperlink",
+    "shared_with_sj_client",
+)
+_DOCUMENT_LOOKUP_FIELDS = ("storage_backend", "type")
+
+
+def populate_document(*, document: DAObject, document_data: dict) -> DAObject:
+    """Copy a single LegalServer Document record onto a DAObject.
+
+    Args:
+        document (DAObject): the DAObject to populate.
+        document_data (dict): one document record from LegalServer.
+
+    Returns:
+        The populated DAObject.
+    """
+    document.uuid = document_data.get("uuid")
+    document.id = document_data.get("id")
+    copy_fields(document, document_data, _DOCUMENT_FIELDS, _DOCUMENT_LOOKUP_FIELDS)
+    set_lookup_values(document, "programs", document_data, "programs")
+    document.complete = True
+    return document
+
+
 def populate_documents(
     *,
     document_list: DAList,
@@ -3343,54 +3417,12 @@ def populate_documents(
         legalserver_site=legalserver_site,
     )
 
-    if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_document = document_list.appendObject()
-                new_document.uuid = item.get("uuid")
-                new_document.id = item.get("id")
-                if item.get("name") is not None:
-                    new_document.name = item.get("name")
-                if item.get("title") is not None:
-                    new_document.title = item.get("title")
-                if item.get("mime_type") is not None:
-                    new_document.mime_type = item.get("mime_type")
-                if item.get("virus_free") is not None:
-                    new_document.virus_free = item.get("virus_free")
-                if item.get("date_create") is not None:
-                    new_document.date_create = item.get("date_create")
-                if item.get("download_url") is not None:
-                    new_document.download_url = item.get("download_url")
-                if item.get("virus_scanned") is not None:
-                    new_document.virus_scanned = item.get("virus_scanned")
-                if item.get("disk_file_size") is not None:
-                    new_document.disk_file_size = item.get("disk_file_size")
-                if item["storage_backend"].get("lookup_value_name") is not None:
-                    new_document.storage_backend = item["storage_backend"].get(
-                        "lookup_value_name"
-                    )
-                if item["type"].get("lookup_value_name") is not None:
-                    new_document.type = item["type"].get("lookup_value_name")
-                temp_list = []
-                for program in item["programs"]:
-                    if program.get("lookup_value_name") is not None:
-                        temp_list.append(program.get("lookup_value_name"))
-                if temp_list:
-                    new_document.programs = temp_list
-                if item.get("folder") is not None:
-                    new_document.folder = item.get("folder")
-                if item.get("funding_code") is not None:
-                    new_document.funding_code = item.get("funding_code")
-                if item.get("hyperlink") is not None:
-                    new_document.hyperlink = item.get("hyperlink")
-                if item.get("shared_with_sj_client") is not None:
-                    new_document.shared_with_sj_client = item.get(
-                        "shared_with_sj_client"
-                    )
-                new_document.complete = True
+    populated_count = 0
+    for item in source:
+        populate_document(document=document_list.appendObject(), document_data=item)
+        populated_count += 1
 
-    log(f"Documents Populated for a case.")
+    log(f"{populated_count} Documents Populated for a case.")
 
     document_list.gathered = True
 
@@ -3412,6 +3444,10 @@ def populate_charges(
     legalserver_data from the `get_matter_details` response is not included, it
     will make an API call using the `search_matter_charges_data` function.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         charge_list (DAList[DAObjects]): DAList of DAObjects
         legalserver_data (dict): Optional dictionary of the matter data from a
@@ -3434,92 +3470,96 @@ def populate_charges(
         legalserver_site=legalserver_site,
     )
 
+    populated_count = 0
     if source:
         for item in source:
-            if isinstance(item, dict):
-                # item: dict = item  # type annoation
-                new_charge = charge_list.appendObject()
-                new_charge.id = item.get("id")
-                new_charge.uuid = item.get("charge_uuid")
-                if item.get("charge_date") is not None:
-                    new_charge.charge_date = item.get("charge_date")
-                if item.get("arraignment_date") is not None:
-                    new_charge.arraignment_date = item.get("arraignment_date")
-                if item.get("warrant_number") is not None:
-                    new_charge.warrant_number = item.get("warrant_number")
-                if item.get("charge_category") is not None:
-                    new_charge.charge_category = item.get("charge_category")
-                if item.get("statute_number") is not None:
-                    new_charge.statute_number = item.get("statute_number")
-                if item.get("penalty_class") is not None:
-                    new_charge.penalty_class = item.get("penalty_class")
-                if item.get("lookup_charge") is not None:
-                    if item["lookup_charge"].get("charge_uuid") is not None:
-                        new_charge.lookup_charge_uuid = item["lookup_charge"].get(
-                            "charge_uuid"
-                        )
-                    if item["lookup_charge"].get("lookup_charge") is not None:
-                        new_charge.lookup_charge = item["lookup_charge"].get(
-                            "lookup_charge"
-                        )
-                if item["charge_outcome_id"].get("lookup_value_name") is not None:
-                    new_charge.charge_outcome_id = item["charge_outcome_id"].get(
-                        "lookup_value_name"
+            # item: dict = item  # type annoation
+            new_charge = charge_list.appendObject()
+            new_charge.id = item.get("id")
+            new_charge.uuid = item.get("charge_uuid")
+            if item.get("charge_date") is not None:
+                new_charge.charge_date = item.get("charge_date")
+            if item.get("arraignment_date") is not None:
+                new_charge.arraignment_date = item.get("arraignment_date")
+            if item.get("warrant_number") is not None:
+                new_charge.warrant_number = item.get("warrant_number")
+            if item.get("charge_category") is not None:
+                new_charge.charge_category = item.get("charge_category")
+            if item.get("statute_number") is not None:
+                new_charge.statute_number = item.get("statute_number")
+            if item.get("penalty_class") is not None:
+                new_charge.penalty_class = item.get("penalty_class")
+            if item.get("lookup_charge") is not None:
+                if item["lookup_charge"].get("charge_uuid") is not None:
+                    new_charge.lookup_charge_uuid = item["lookup_charge"].get(
+                        "charge_uuid"
                     )
-                if item.get("disposition_date") is not None:
-                    new_charge.disposition_date = item.get("disposition_date")
-                if item.get("top_charge") is not None:
-                    new_charge.top_charge = item.get("top_charge")
-                if item.get("note") is not None:
-                    new_charge.note = item.get("note")
-                if item["previous_charge_id"].get("lookup_value_name") is not None:
-                    new_charge.previous_charge_id = item["previous_charge_id"].get(
-                        "lookup_value_name"
+                if item["lookup_charge"].get("lookup_charge") is not None:
+                    new_charge.lookup_charge = item["lookup_charge"].get(
+                        "lookup_charge"
                     )
-                if item.get("charge_reduction_date") is not None:
-                    new_charge.charge_reduction_date = item.get("charge_reduction_date")
-                temp_list = []
-                for tag in item["charge_tag_id"]:
-                    if tag.get("lookup_value_name") is not None:
-                        temp_list.append(tag.get("lookup_value_name"))
-                if temp_list:
-                    new_charge.charge_tag_id = temp_list
-                del temp_list
-                if item.get("issue_note") is not None:
-                    new_charge.issue_note = item.get("issue_note")
-                if item.get("dynamic_process") is not None:
-                    if item["dynamic_process"].get("dynamic_process_id") is not None:
-                        new_charge.dynamic_process_id = item["dynamic_process"].get(
-                            "dynamic_process_id"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_uuid") is not None:
-                        new_charge.dynamic_process_uuid = item["dynamic_process"].get(
-                            "dynamic_process_uuid"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_name") is not None:
-                        new_charge.dynamic_process_name = item["dynamic_process"].get(
-                            "dynamic_process_name"
-                        )
-                if item.get("external_id") is not None:
-                    new_charge.external_id = item.get("external_id")
-
-                standard_key_list = standard_charges_keys()
-                custom_fields = {
-                    key: value
-                    for key, value in item.items()
-                    if key not in standard_key_list
-                }
-                if custom_fields is not None:
-                    new_charge.custom_fields = custom_fields
-                del custom_fields
-                new_charge.complete = True
+            set_lookup_value(new_charge, "charge_outcome_id", item, "charge_outcome_id")
+            if item.get("disposition_date") is not None:
+                new_charge.disposition_date = item.get("disposition_date")
+            if item.get("top_charge") is not None:
+                new_charge.top_charge = item.get("top_charge")
+            if item.get("note") is not None:
+                new_charge.note = item.get("note")
+            set_lookup_value(
+                new_charge, "previous_charge_id", item, "previous_charge_id"
+            )
+            if item.get("charge_reduction_date") is not None:
+                new_charge.charge_reduction_date = item.get("charge_reduction_date")
+            set_lookup_values(new_charge, "charge_tag_id", item, "charge_tag_id")
+            if item.get("issue_note") is not None:
+                new_charge.issue_note = item.get("issue_note")
+            if item.get("dynamic_process") is not None:
+                if item["dynamic_process"].get("dynamic_process_id") is not None:
+                    new_charge.dynamic_process_id = item["dynamic_process"].get(
+                        "dynamic_process_id"
+                    )
+                if item["dynamic_process"].get("dynamic_process_uuid") is not None:
+                    new_charge.dynamic_process_uuid = item["dynamic_process"].get(
+                        "dynamic_process_uuid"
+                    )
+                if item["dynamic_process"].get("dynamic_process_name") is not None:
+                    new_charge.dynamic_process_name = item["dynamic_process"].get(
+                        "dynamic_process_name"
+                    )
+            if item.get("external_id") is not None:
+                new_charge.external_id = item.get("external_id")
 
-    log(f"Charges Populated for a case.")
+            set_custom_fields(new_charge, item, _STANDARD_CHARGES_KEYS)
+            new_charge.complete = True
+            populated_count += 1
+
+    log(f"{populated_count} Charges Populated for a case.")
 
     charge_list.gathered = True
     return charge_list
 
 
+# Service fields for copy_fields.
+_SERVICE_FIELDS = (
+    "title",
+    "start_date",
+    "end_date",
+    "note",
+    "closed",
+    "active",
+    "funding_code",
+    "external_id",
+)
+_SERVICE_LOOKUP_FIELDS = ("type", "decision")
+_SERVICE_NESTED_FIELDS = (
+    ("closed_by", "user_uuid", "closed_by_uuid"),
+    ("closed_by", "user_name", "closed_by_name"),
+    ("dynamic_process", "dynamic_process_id", "dynamic_process_id"),
+    ("dynamic_process", "dynamic_process_uuid", "dynamic_process_uuid"),
+    ("dynamic_process", "dynamic_process_name", "dynamic_process_name"),
+)
+
+
 def populate_services(
     *,
     services_list: DAList,
@@ -3535,6 +3575,10 @@ def populate_services(
     legalserver_data from the `get_matter_details` response is not included, it will
     make an API call using the `search_matter_services_data` function.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on each object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         service_list (DAList[DAObject]): DAList of DAObjects.
         legalserver_data (dict): Optional dictionary of the matter data from a
@@ -3557,68 +3601,60 @@ def populate_services(
     )
 
     if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: DAObject = item  # type annotation
-                new_service = services_list.appendObject()
-                new_service.id = item.get("id")
-                new_service.uuid = item.get("uuid")
-
-                if item.get("title") is not None:
-                    new_service.title = item.get("title")
-                if item.get("start_date") is not None:
-                    new_service.start_date = item.get("start_date")
-                if item["type"].get("lookup_value_name") is not None:
-                    new_service.type = item["type"].get("lookup_value_name")
-                if item.get("end_date") is not None:
-                    new_service.end_date = item.get("end_date")
-                if item.get("closed_by") is not None:
-                    if item["closed_by"].get("user_uuid") is not None:
-                        new_service.closed_by_uuid = item["closed_by"].get("user_uuid")
-                    if item["closed_by"].get("user_name") is not None:
-                        new_service.closed_by_name = item["closed_by"].get("user_name")
-                if item.get("note") is not None:
-                    new_service.note = item.get("note")
-                if item.get("closed") is not None:
-                    new_service.closed = item.get("closed")
-                if item.get("active") is not None:
-                    new_service.active = item.get("active")
-                if item.get("dynamic_process") is not None:
-                    if item["dynamic_process"].get("dynamic_process_id") is not None:
-                        new_service.dynamic_process_id = item["dynamic_process"].get(
-                            "dynamic_process_id"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_uuid") is not None:
-                        new_service.dynamic_process_uuid = item["dynamic_process"].get(
-                            "dynamic_process_uuid"
-                        )
-                    if item["dynamic_process"].get("dynamic_process_name") is not None:
-                        new_service.dynamic_process_name = item["dynamic_process"].get(
-                            "dynamic_process_name"
-                        )
-                if item["decision"].get("lookup_value_name") is not None:
-                    new_service.decision = item["decision"].get("lookup_value_name")
-                if item.get("funding_code") is not None:
-                    new_service.funding_code = item.get("funding_code")
-                if item.get("external_id") is not None:
-                    new_service.external_id = item.get("external_id")
-
-                standard_key_list = standard_services_keys()
-                custom_fields = {
-                    key: value
-                    for key, value in item.items()
-                    if key not in standard_key_list
-                }
-                if custom_fields is not None:
-                    new_service.custom_fields = custom_fields
-                del custom_fields
-                new_service.complete = True
-        log(f"Services Populated for a case.")
+        populated_count = populate_records(
+            record_list=services_list,
+            source=source,
+            id_fields={"id": "id", "uuid": "uuid"},
+            fields=_SERVICE_FIELDS,
+            lookup_fields=_SERVICE_LOOKUP_FIELDS,
+            nested_fields=_SERVICE_NESTED_FIELDS,
+            standard_keys=_STANDARD_SERVICES_KEYS,
+        )
+        log(f"{populated_count} Services Populated for a case.")
 
     services_list.gathered = True
     return services_list
 
 
+# Case Contact keys mapped to the attribute they are saved to on the Individual
+_CONTACT_FIELDS = {
+    "contact_uuid": "contact_uuid",
+    "business_phone": "phone",
+    "email": "email",
+}
+
+
+def populate_contact(*, contact: Individual, contact_data: dict) -> Individual:
+    """Copy a single LegalServer Case Contact record onto an Individual.
+
+    Args:
+        contact (Individual): the Individual to populate.
+        contact_data (dict): one case contact record from LegalServer.
+
+    Returns:
+        The populated Individual.
+    """
+    # contact.id = contact_data.get('id')
+    contact.uuid = contact_data.get("case_contact_uuid")
+    # a single pass over the record instead of one lookup per field
+    for key, value in contact_data.items():
+        if value is None:
+            continue
+        if key in _NAME_FIELDS:
+            setattr(contact.name, key, value)
+        elif key in _CONTACT_FIELDS:
+            setattr(contact, _CONTACT_FIELDS[key], value)
+    set_lookup_value(contact, "type", contact_data, "case_contact_type")
+    contact.contact_types = [
+        type.get("lookup_value_name")
+        for type in contact_data.get("contact_types") or ()
+        if type.get("lookup_value_name") is not None
+    ]
+
+    contact.complete = True
+    return contact
+
+
 def populate_contacts(
     *,
     contact_list: DAList,
@@ -3656,43 +3692,110 @@ def populate_contacts(
         legalserver_site=legalserver_site,
     )
 
+    populated_count = 0
     if source:
-        for item in source:
-            if isinstance(item, dict):
-                # item: Individual = item  # type annotation
-                new_contact = contact_list.appendObject(Individual)
-                # new_contact.id = item.get('id')
-                new_contact.uuid = item.get("case_contact_uuid")
-                if item.get("contact_uuid") is not None:
-                    new_contact.contact_uuid = item.get("contact_uuid")
-                if item.get("first") is not None:
-                    new_contact.name.first = item.get("first")
-                if item.get("middle") is not None:
-                    new_contact.name.middle = item.get("middle")
-                if item.get("last") is not None:
-                    new_contact.name.last = item.get("last")
-                if item["case_contact_type"].get("lookup_value_name") is not None:
-                    new_contact.type = item["case_contact_type"].get(
-                        "lookup_value_name"
-                    )
-                if item.get("suffix") is not None:
-                    new_contact.name.suffix = item.get("suffix")
-                if item.get("business_phone") is not None:
-                    new_contact.phone = item.get("business_phone")
-                if item.get("email") is not None:
-                    new_contact.email = item.get("email")
-                new_contact.contact_types = []
-                for type in item["contact_types"]:
-                    if type.get("lookup_value_name") is not None:
-                        new_contact.contact_types.append(type.get("lookup_value_name"))
-
-                new_contact.complete = True
-                log(f"Contacts Populated for a case.")
+        # skip empty or error rows before creating an Individual for them
+        items = [item for item in source if item and item.get("error") is None]
+        for item in items:
+            populate_contact(
+                contact=contact_list.appendObject(Individual), contact_data=item
+            )
+        populated_count = len(items)
+        log(f"{populated_count} Contacts Populated for a case.")
 
     contact_list.gathered = True
     return contact_list
 
 
+def populate_address(
+    *, address: Address, address_data: dict, gis: bool = False
+) -> Address:
+    """Take an address record from LegalServer and populate an Address.
+
+    This is a helper for `populate_client` and `populate_user_data` so every
+    address shares the same street, unit, city, state, and zip handling. When
+    both an apartment number and a second street line are present, the
+    apartment number is saved as the unit and the second street line is added
+    to the street address.
+
+    Args:
+        address (Address): the Address object to populate.
+        address_data (dict): the address dictionary from LegalServer.
+        gis (bool): Optional flag to also save the county, the GIS fields, and
+            any non-standard keys. Only the home address includes these.
+
+    Returns:
+        The populated Address object.
+    """
+    street = address_data.get("street")
+    street_2 = address_data.get("street_2")
+    apt_num = address_data.get("apt_num")
+    if street is not None:
+        address.address = street
+    ## LS Supports both Apt Num and Street2
+    if apt_num is not None and street_2 is not None:
+        address.unit = apt_num
+        address.address = street_2 if street is None else f"{street}, {street_2}"
+    elif apt_num is not None:
+        address.unit = apt_num
+    elif street_2 is not None:
+        address.unit = street_2
+    if address_data.get("city") is not None:
+        address.city = address_data.get("city")
+    if address_data.get("state") is not None:
+        address.state = address_data.get("state")
+    if address_data.get("zip") is not None:
+        address.zip = address_data.get("zip")
+    if not gis:
+        return address
+
+    set_lookup_value(address, "county", address_data, "county")
+
+    # GIS Fields
+    if address_data.get("lon") is not None:
+        address.ls_longitude = address_data.get("lon")
+    if address_data.get("lat") is not None:
+        address.ls_latitude = address_data.get("lat")
+    set_lookup_value(address, "census_tract", address_data, "census_tract")
+    if address_data.get("geocoding_failed") is not None:
+        address.ls_geocoding_failed = address_data.get("geocoding_failed")
+    for key in (
+        "state_legislature_district_upper",
+        "state_legislature_district_lower",
+        "congressional_district",
+    ):
+        if address_data.get(key) is not None:
+            if address_data[key].get("lookup_value_name") is not None:
+                setattr(address, key, address_data[key].get("lookup_value_name"))
+
+    standard_client_home_address_key_list = _STANDARD_CLIENT_HOME_ADDRESS_KEYS
+    for key, value in address_data.items():
+        if key not in standard_client_home_address_key_list:
+            if isinstance(value, dict):
+                if value.get("lookup_value_name") is not None:
+                    setattr(address, key, value.get("lookup_value_name"))
+            else:
+                setattr(address, key, value)
+
+    return address
+
+
+# Keys that make a secondary address worth creating.
+_ADDRESS_FIELDS = ("street", "apt_num", "street_2", "city", "state", "zip")
+
+
+def populate_optional_address(
+    *, target: DAObject, attribute: str, address_data: dict | None
+) -> None:
+    """Helper function to create an Address as `attribute` on `target` and
+    populate it, only when the LegalServer address has at least one field."""
+    if address_data is None:
+        return
+    if any(address_data.get(key) is not None for key in _ADDRESS_FIELDS):
+        target.initializeAttribute(attribute, Address)
+        populate_address(address=getattr(target, attribute), address_data=address_data)
+
+
 def populate_client(
     *, client: Individual | Person, legalserver_data: dict
 ) -> Individual | Person:
@@ -3712,18 +3815,11 @@ def populate_client(
         A populated client object.
     """
 
+    # Individual and Person both set up their name on creation, so there is
+    # nothing to initialize here
     if legalserver_data.get("is_group"):
         client.name.text = legalserver_data.get("organization_name")
-    else:
-        client.initializeAttribute("name", IndividualName)
-    if legalserver_data.get("first") is not None:
-        client.name.first = legalserver_data.get("first")
-    if legalserver_data.get("last") is not None:
-        client.name.last = legalserver_data.get("last")
-    if legalserver_data.get("middle") is not None:
-        client.name.middle = legalserver_data.get("middle")
-    if legalserver_data.get("suffix") is not None:
-        client.name.suffix = legalserver_data.get("suffix")
+    copy_fields(client.name, legalserver_data, _NAME_FIELDS)
 
     # Client Details
 
@@ -3781,66 +3877,26 @@ def populate_client(
     if legalserver_data.get("fax_phone_note") is not None:
         client.other_phone_note = legalserver_data.get("fax_phone_note")
 
-    if legalserver_data.get("language") is not None:
-        if legalserver_data["language"].get("lookup_value_name") is not None:
-            client.language_name = legalserver_data["language"].get("lookup_value_name")
-            if (
-                language_code_from_name(
-                    legalserver_data["language"].get("lookup_value_name")
-                )
-                != "Unknown"
-            ):
-                client.language = language_code_from_name(
-                    legalserver_data["language"].get("lookup_value_name")
-                )
-    if legalserver_data.get("second_language") is not None:
-        if legalserver_data["second_language"].get("lookup_value_name") is not None:
-            client.second_language_name = legalserver_data["second_language"].get(
-                "lookup_value_name"
-            )
-            if (
-                language_code_from_name(
-                    legalserver_data["second_language"].get("lookup_value_name")
-                )
-                != "Unknown"
-            ):
-                client.second_language = language_code_from_name(
-                    legalserver_data["second_language"].get("lookup_value_name")
-                )
+    set_language(client, "language", legalserver_data, "language")
+    set_language(client, "second_language", legalserver_data, "second_language")
 
     if legalserver_data.get("interpreter") is not None:
         client.interpreter = legalserver_data.get("interpreter")
-    if legalserver_data.get("marital_status") is not None:
-        if legalserver_data["marital_status"].get("lookup_value_name") is not None:
-            client.marital_status = legalserver_data["marital_status"].get(
-                "lookup_value_name"
-            )
-    if legalserver_data.get("citizenship") is not None:
-        if legalserver_data["citizenship"].get("lookup_value_name") is not None:
-            client.citizenship = legalserver_data["citizenship"].get(
-                "lookup_value_name"
-            )
-    if legalserver_data.get("citizenship_country") is not None:
-        if legalserver_data["citizenship_country"].get("lookup_value_name") is not None:
-            client.citizenship_country = legalserver_data["citizenship_country"].get(
-                "lookup_value_name"
-            )
-    if legalserver_data.get("immigration_status") is not None:
-        if legalserver_data["immigration_status"].get("lookup_value_name") is not None:
-            client.immigration_status = legalserver_data["immigration_status"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(client, "marital_status", legalserver_data, "marital_status")
+    set_lookup_value(client, "citizenship", legalserver_data, "citizenship")
+    set_lookup_value(
+        client, "citizenship_country", legalserver_data, "citizenship_country"
+    )
+    set_lookup_value(
+        client, "immigration_status", legalserver_data, "immigration_status"
+    )
     if legalserver_data.get("a_number") is not None:
         client.a_number = legalserver_data.get("a_number")
     if legalserver_data.get("visa_number") is not None:
         client.visa_number = legalserver_data.get("visa_number")
 
-    if legalserver_data.get("race") is not None:
-        if legalserver_data["race"].get("lookup_value_name") is not None:
-            client.race = legalserver_data["race"].get("lookup_value_name")
-    if legalserver_data.get("ethnicity") is not None:
-        if legalserver_data["ethnicity"].get("lookup_value_name") is not None:
-            client.ethnicity = legalserver_data["ethnicity"].get("lookup_value_name")
+    set_lookup_value(client, "race", legalserver_data, "race")
+    set_lookup_value(client, "ethnicity", legalserver_data, "ethnicity")
     if legalserver_data.get("current_living_situation") is not None:
         if (
             legalserver_data["current_living_situation"].get("lookup_value_name")
@@ -3855,18 +3911,10 @@ def populate_client(
         )
     if legalserver_data.get("birth_city") is not None:
         client.birth_city = legalserver_data.get("birth_city")
-    if legalserver_data.get("birth_country") is not None:
-        if legalserver_data["birth_country"].get("lookup_value_name") is not None:
-            client.birth_country = legalserver_data["birth_country"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(client, "birth_country", legalserver_data, "birth_country")
     if legalserver_data.get("drivers_license") is not None:
         client.drivers_license = legalserver_data.get("drivers_license")
-    if legalserver_data.get("highest_education") is not None:
-        if legalserver_data["highest_education"].get("lookup_value_name") is not None:
-            client.highest_education = legalserver_data["highest_education"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(client, "highest_education", legalserver_data, "highest_education")
     if legalserver_data.get("institutionalized") is not None:
         client.institutionalized = legalserver_data.get("institutionalized")
     if legalserver_data.get("institutionalized_at") is not None:
@@ -3884,196 +3932,26 @@ def populate_client(
             client.institutionalized_organization_name = legalserver_data[
                 "institutionalized_at"
             ].get("organization_name")
-    if legalserver_data.get("school_status") is not None:
-        if legalserver_data["school_status"].get("lookup_value_name") is not None:
-            client.school_status = legalserver_data["school_status"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(client, "school_status", legalserver_data, "school_status")
     if legalserver_data.get("military_status") is not None:
-        if legalserver_data["military_service"].get("lookup_value_name") is not None:
-            client.military_service = legalserver_data["military_service"].get(
-                "lookup_value_name"
-            )
+        set_lookup_value(
+            client, "military_service", legalserver_data, "military_service"
+        )
 
     # Client Home Address
     if legalserver_data.get("client_address_home") is not None:
-        if legalserver_data["client_address_home"].get("street") is not None:
-            client.address.address = legalserver_data["client_address_home"].get(
-                "street"
-            )
-        ## LS Supports both Apt Num and Street2
-        if (
-            legalserver_data["client_address_home"].get("street_2") is not None
-            and legalserver_data["client_address_home"].get("apt_num") is None
-        ):
-            client.address.unit = legalserver_data["client_address_home"].get(
-                "street_2"
-            )
-        if (
-            legalserver_data["client_address_home"].get("apt_num") is not None
-            and legalserver_data["client_address_home"].get("street_2") is None
-        ):
-            client.address.unit = legalserver_data["client_address_home"].get("apt_num")
-        if (
-            legalserver_data["client_address_home"].get("apt_num") is not None
-            and legalserver_data["client_address_home"].get("street_2") is not None
-        ):
-            client.address.unit = legalserver_data["client_address_home"].get("apt_num")
-            if client.address.address is None:
-                client.address.address = legalserver_data["client_address_home"].get(
-                    "street_2"
-                )
-            else:
-                client.address.address = f'{client.address.address}, {legalserver_data["client_address_home"].get("street_2")}'
-        if legalserver_data["client_address_home"].get("city") is not None:
-            client.address.city = legalserver_data["client_address_home"].get("city")
-        if legalserver_data["client_address_home"].get("state") is not None:
-            client.address.state = legalserver_data["client_address_home"].get("state")
-        if legalserver_data["client_address_home"].get("zip") is not None:
-            client.address.zip = legalserver_data["client_address_home"].get("zip")
-        if (
-            legalserver_data["client_address_home"]["county"].get("lookup_value_name")
-            is not None
-        ):
-            client.address.county = legalserver_data["client_address_home"][
-                "county"
-            ].get("lookup_value_name")
-
-        # GIS Fields
-        if legalserver_data["client_address_home"].get("lon") is not None:
-            client.address.ls_longitude = legalserver_data["client_address_home"].get(
-                "lon"
-            )
-        if legalserver_data["client_address_home"].get("lat") is not None:
-            client.address.ls_latitude = legalserver_data["client_address_home"].get(
-                "lat"
-            )
-        if legalserver_data["client_address_home"].get("census_tract") is not None:
-            if (
-                legalserver_data["client_address_home"]["census_tract"].get(
-                    "lookup_value_name"
-                )
-                is not None
-            ):
-                client.address.census_tract = legalserver_data[
-                    "client_address_home"
-                ].get("")
-        if legalserver_data["client_address_home"].get("geocoding_failed") is not None:
-            client.address.ls_geocoding_failed = legalserver_data[
-                "client_address_home"
-            ].get("geocoding_failed")
-        if (
-            legalserver_data["client_address_home"].get(
-                "state_legislature_district_upper"
-            )
-            is not None
-        ):
-            if (
-                legalserver_data["client_address_home"][
-                    "state_legislature_district_upper"
-                ].get("lookup_value_name")
-                is not None
-            ):
-                client.address.state_legislature_district_upper = legalserver_data[
-                    "client_address_home"
-                ]["state_legislature_district_upper"].get("lookup_value_name")
-        if (
-            legalserver_data["client_address_home"].get(
-                "state_legislature_district_lower"
-            )
-            is not None
-        ):
-            if (
-                legalserver_data["client_address_home"][
-                    "state_legislature_district_lower"
-                ].get("lookup_value_name")
-                is not None
-            ):
-                client.address.state_legislature_district_lower = legalserver_data[
-                    "client_address_home"
-                ]["state_legislature_district_lower"].get("lookup_value_name")
-        if (
-            legalserver_data["client_address_home"].get("congressional_district")
-            is not None
-        ):
-            if (
-                legalserver_data["client_address_home"]["congressional_district"].get(
-                    "lookup_value_name"
-                )
-                is not None
-            ):
-                client.address.congressional_district = legalserver_data[
-                    "client_address_home"
-                ]["congressional_district"].get("lookup_value_name")
-
-        standard_client_home_address_key_list = standard_client_home_address_keys()
-        for key, value in legalserver_data["client_address_home"].items():
-            if key not in standard_client_home_address_key_list:
-                if isinstance(value, dict):
-                    if value.get("lookup_value_name") is not None:
-                        setattr(client.address, key, value.get("lookup_value_name"))
-
-                #                        client.address[key] = value.get("lookup_value_name")
-                else:
-                    #                    client.address[key] = value
-                    setattr(client.address, key, value)
+        populate_address(
+            address=client.address,
+            address_data=legalserver_data["client_address_home"],
+            gis=True,
+        )
 
     # Client Mailing Address
-    if legalserver_data.get("client_address_mailing") is not None:
-        if (
-            legalserver_data["client_address_mailing"].get("street") is not None
-            or legalserver_data["client_address_mailing"].get("apt_num") is not None
-            or legalserver_data["client_address_mailing"].get("street_2") is not None
-            or legalserver_data["client_address_mailing"].get("city") is not None
-            or legalserver_data["client_address_mailing"].get("state") is not None
-            or legalserver_data["client_address_mailing"].get("zip") is not None
-        ):
-            client.initializeAttribute("mailing_address", Address)
-
-        if legalserver_data["client_address_mailing"].get("street") is not None:
-            client.mailing_address.address = legalserver_data[
-                "client_address_mailing"
-            ].get("street")
-        ## LS Supports both Apt Num and Street2
-        if (
-            legalserver_data["client_address_mailing"].get("street_2") is not None
-            and legalserver_data["client_address_mailing"].get("apt_num") is None
-        ):
-            client.mailing_address.unit = legalserver_data[
-                "client_address_mailing"
-            ].get("street_2")
-        if (
-            legalserver_data["client_address_mailing"].get("apt_num") is not None
-            and legalserver_data["client_address_mailing"].get("street_2") is None
-        ):
-            client.mailing_address.unit = legalserver_data[
-                "client_address_mailing"
-            ].get("apt_num")
-        if (
-            legalserver_data["client_address_mailing"].get("apt_num") is not None
-            and legalserver_data["client_address_mailing"].get("street_2") is not None
-        ):
-            client.mailing_address.unit = legalserver_data[
-                "client_address_mailing"
-            ].get("apt_num")
-            if client.mailing_address.address is None:
-                client.mailing_address.address = legalserver_data[
-                    "client_address_mailing"
-                ].get("street_2")
-            else:
-                client.mailing_address.address = f'{client.mailing_address.address}, {legalserver_data["client_address_mailing"].get("street_2")}'
-        if legalserver_data["client_address_mailing"].get("city") is not None:
-            client.mailing_address.city = legalserver_data[
-                "client_address_mailing"
-            ].get("city")
-        if legalserver_data["client_address_mailing"].get("state") is not None:
-            client.mailing_address.state = legalserver_data[
-                "client_address_mailing"
-            ].get("state")
-        if legalserver_data["client_address_mailing"].get("zip") is not None:
-            client.mailing_address.zip = legalserver_data["client_address_mailing"].get(
-                "zip"
-            )
+    populate_optional_address(
+        target=client,
+        attribute="mailing_address",
+        address_data=legalserver_data.get("client_address_mailing"),
+    )
 
     return client
 
@@ -4085,6 +3963,10 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
     with the case related details related to a case. It requires the general
     legalserver_data from the `get_matter_details` response.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on the object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         case (DAObject): DAObject holding all the case data
         legalserver_data (dict): the full case data returned from the Get Matter
@@ -4133,11 +4015,7 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
             case.prescreen_user_name = legalserver_data["prescreen_user"].get(
                 "user_name"
             )
-    if legalserver_data.get("prescreen_program") is not None:
-        if legalserver_data["prescreen_program"].get("lookup_value_name") is not None:
-            case.prescreen_program = legalserver_data["prescreen_program"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(case, "prescreen_program", legalserver_data, "prescreen_program")
     if legalserver_data.get("prescreen_office") is not None:
         if legalserver_data.get("prescreen_office") is not None:
             if legalserver_data["prescreen_office"].get("office_code") is not None:
@@ -4153,10 +4031,7 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
             case.intake_user_uuid = legalserver_data["intake_user"].get("user_uuid")
         if legalserver_data["intake_user"].get("user_name") is not None:
             case.intake_user_name = legalserver_data["intake_user"].get("user_name")
-    if legalserver_data["intake_program"].get("lookup_value_name") is not None:
-        case.intake_program = legalserver_data["intake_program"].get(
-            "lookup_value_name"
-        )
+    set_lookup_value(case, "intake_program", legalserver_data, "intake_program")
     if legalserver_data.get("intake_office") is not None:
         if legalserver_data["intake_office"].get("office_code") is not None:
             case.intake_office_code = legalserver_data["intake_office"].get(
@@ -4182,10 +4057,9 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
     if legalserver_data.get("date_rejected") is not None:
         case.date_rejected = legalserver_data.get("date_rejected")
     if legalserver_data.get("county_of_dispute") is not None:
-        if legalserver_data["county_of_dispute"].get("lookup_value_name") is not None:
-            case.county_of_dispute_name = legalserver_data["county_of_dispute"].get(
-                "lookup_value_name"
-            )
+        set_lookup_value(
+            case, "county_of_dispute_name", legalserver_data, "county_of_dispute"
+        )
         if legalserver_data["county_of_dispute"].get("lookup_value_state") is not None:
             case.county_of_dispute_state = legalserver_data["county_of_dispute"].get(
                 "lookup_value_state"
@@ -4194,36 +4068,24 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
             case.county_of_dispute_FIPS = legalserver_data["county_of_dispute"].get(
                 "lookup_value_FIPS"
             )
-    if legalserver_data["legal_problem_code"].get("lookup_value_name") is not None:
-        case.legal_problem_code = legalserver_data["legal_problem_code"].get(
-            "lookup_value_name"
-        )
-    if legalserver_data["legal_problem_category"].get("lookup_value_name") is not None:
-        case.legal_problem_category = legalserver_data["legal_problem_category"].get(
-            "lookup_value_name"
-        )
-    temp_list = []
-    for slpc in legalserver_data["special_legal_problem_code"]:
-        if slpc.get("lookup_value_name") is not None:
-            temp_list.append(slpc.get("lookup_value_name"))
-    if temp_list:
-        case.special_legal_problem_code = temp_list
-    del temp_list
-    if legalserver_data["intake_type"].get("lookup_value_name") is not None:
-        case.intake_type = legalserver_data["intake_type"].get("lookup_value_name")
+    set_lookup_value(case, "legal_problem_code", legalserver_data, "legal_problem_code")
+    set_lookup_value(
+        case, "legal_problem_category", legalserver_data, "legal_problem_category"
+    )
+    set_lookup_values(
+        case,
+        "special_legal_problem_code",
+        legalserver_data,
+        "special_legal_problem_code",
+    )
+    set_lookup_value(case, "intake_type", legalserver_data, "intake_type")
     if legalserver_data.get("impact") is not None:
         case.impact = legalserver_data.get("impact")
-    temp_list = []
-    for sc in legalserver_data["special_characteristics"]:
-        if sc.get("lookup_value_name") is not None:
-            temp_list.append(sc.get("lookup_value_name"))
-    if temp_list:
-        case.special_characteristics = temp_list
-    del temp_list
-    if legalserver_data["case_status"].get("lookup_value_name") is not None:
-        case.case_status = legalserver_data["case_status"].get("lookup_value_name")
-    if legalserver_data["close_reason"].get("lookup_value_name") is not None:
-        case.close_reason = legalserver_data["close_reason"].get("lookup_value_name")
+    set_lookup_values(
+        case, "special_characteristics", legalserver_data, "special_characteristics"
+    )
+    set_lookup_value(case, "case_status", legalserver_data, "case_status")
+    set_lookup_value(case, "close_reason", legalserver_data, "close_reason")
     if legalserver_data.get("pro_bono_opportunity_summary") is not None:
         case.pro_bono_opportunity_summary = legalserver_data.get(
             "pro_bono_opportunity_summary"
@@ -4280,20 +4142,15 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.pro_bono_urgent = legalserver_data.get("pro_bono_urgent")
     if legalserver_data.get("pro_bono_interest_cc") is not None:
         case.pro_bono_interest_cc = legalserver_data.get("pro_bono_interest_cc")
-    temp_list = []
-    for skill in legalserver_data["pro_bono_skills_developed"]:
-        if skill.get("lookup_value_name") is not None:
-            temp_list.append(skill.get("lookup_value_name"))
-    if temp_list:
-        case.pro_bono_skills_developed = temp_list
-    del temp_list
-    temp_list = []
-    for vol in legalserver_data["pro_bono_appropriate_volunteer"]:
-        if vol.get("lookup_value_name") is not None:
-            temp_list.append(vol.get("lookup_value_name"))
-    if temp_list != []:
-        case.pro_bono_appropriate_volunteer = temp_list
-    del temp_list
+    set_lookup_values(
+        case, "pro_bono_skills_developed", legalserver_data, "pro_bono_skills_developed"
+    )
+    set_lookup_values(
+        case,
+        "pro_bono_appropriate_volunteer",
+        legalserver_data,
+        "pro_bono_appropriate_volunteer",
+    )
     if legalserver_data.get("pro_bono_expiration_date") is not None:
         case.pro_bono_expiration_date = legalserver_data.get("pro_bono_expiration_date")
     if (
@@ -4305,38 +4162,31 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         ].get("lookup_value_name")
     if legalserver_data.get("pro_bono_opportunity_cc") is not None:
         case.pro_bono_opportunity_cc = legalserver_data.get("pro_bono_opportunity_cc")
-    temp_list = []
-    for topic in legalserver_data["simplejustice_opportunity_legal_topic"]:
-        if topic.get("lookup_value_name") is not None:
-            temp_list.append(topic.get("lookup_value_name"))
-    if temp_list != []:
-        case.simplejustice_opportunity_legal_topic = temp_list
-    del temp_list
-    temp_list = []
-    for community in legalserver_data["simplejustice_opportunity_helped_community"]:
-        if community.get("lookup_value_name") is not None:
-            temp_list.append(community.get("lookup_value_name"))
-    if temp_list != []:
-        case.simplejustice_opportunity_helped_community = temp_list
-    del temp_list
-    temp_list = []
-    for skill in legalserver_data["simplejustice_opportunity_skill_type"]:
-        if skill.get("lookup_value_name") is not None:
-            temp_list.append(skill.get("lookup_value_name"))
-    if temp_list != []:
-        case.simplejustice_opportunity_skill_type = temp_list
-    del temp_list
-    temp_list = []
-    for community in legalserver_data["simplejustice_opportunity_community"]:
-        if community.get("lookup_value_name") is not None:
-            temp_list.append(community.get("lookup_value_name"))
-    if temp_list != []:
-        case.simplejustice_opportunity_community = temp_list
-    del temp_list
-    if legalserver_data["level_of_expertise"].get("lookup_value_name") is not None:
-        case.level_of_expertise = legalserver_data["level_of_expertise"].get(
-            "lookup_value_name"
-        )
+    set_lookup_values(
+        case,
+        "simplejustice_opportunity_legal_topic",
+        legalserver_data,
+        "simplejustice_opportunity_legal_topic",
+    )
+    set_lookup_values(
+        case,
+        "simplejustice_opportunity_helped_community",
+        legalserver_data,
+        "simplejustice_opportunity_helped_community",
+    )
+    set_lookup_values(
+        case,
+        "simplejustice_opportunity_skill_type",
+        legalserver_data,
+        "simplejustice_opportunity_skill_type",
+    )
+    set_lookup_values(
+        case,
+        "simplejustice_opportunity_community",
+        legalserver_data,
+        "simplejustice_opportunity_community",
+    )
+    set_lookup_value(case, "level_of_expertise", legalserver_data, "level_of_expertise")
     if legalserver_data.get("days_open") is not None:
         case.days_open = legalserver_data.get("days_open")
 
@@ -4348,17 +4198,10 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.lsc_eligible = legalserver_data.get("lsc_eligible")
     if legalserver_data.get("income_eligible") is not None:
         case.income_eligible = legalserver_data.get("income_eligible")
-    if legalserver_data["how_referred"].get("lookup_value_name") is not None:
-        case.how_referred = legalserver_data["how_referred"].get("lookup_value_name")
+    set_lookup_value(case, "how_referred", legalserver_data, "how_referred")
     if legalserver_data.get("number_of_adults") is not None:
         case.number_of_adults = legalserver_data.get("number_of_adults")
-    temp_list = []
-    for rest in legalserver_data["case_restrictions"]:
-        if rest.get("lookup_value_name") is not None:
-            temp_list.append(rest.get("lookup_value_name"))
-    if temp_list:
-        case.case_restrictions = temp_list
-    del temp_list
+    set_lookup_values(case, "case_restrictions", legalserver_data, "case_restrictions")
     ## these are users, perhaps do something else
     if legalserver_data.get("case_exclusions") is not None:
         case.case_exclusions = legalserver_data.get("case_exclusions")
@@ -4380,10 +4223,7 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.conflict_waived = legalserver_data.get("conflict_waived")
     if legalserver_data.get("ap_conflict_waived") is not None:
         case.ap_conflict_waived = legalserver_data.get("ap_conflict_waived")
-    if legalserver_data["ssi_welfare_status"].get("lookup_value_name") is not None:
-        case.ssi_welfare_status = legalserver_data["ssi_welfare_status"].get(
-            "lookup_value_name"
-        )
+    set_lookup_value(case, "ssi_welfare_status", legalserver_data, "ssi_welfare_status")
     if (
         legalserver_data.get("ssi_months_client_has_received_welfare_payments")
         is not None
@@ -4405,13 +4245,9 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
     ## these are organizations, perhaps do something else.
     if legalserver_data.get("referring_organizations") is not None:
         case.referring_organizations = legalserver_data.get("referring_organizations")
-    temp_list = []
-    for add in legalserver_data["additional_assistance"]:
-        if add.get("lookup_value_name") is not None:
-            temp_list.append(add.get("lookup_value_name"))
-    if temp_list:
-        case.additional_assistance = temp_list
-    del temp_list
+    set_lookup_values(
+        case, "additional_assistance", legalserver_data, "additional_assistance"
+    )
     if legalserver_data.get("pai_case") is not None:
         case.pai_case = legalserver_data.get("pai_case")
     if legalserver_data.get("client_approved_transfer") is not None:
@@ -4422,13 +4258,7 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.transfer_reject_notes = legalserver_data.get("transfer_reject_notes")
     if legalserver_data.get("prior_client") is not None:
         case.prior_client = legalserver_data.get("prior_client")
-    temp_list = []
-    for pro in legalserver_data["priorities"]:
-        if pro.get("lookup_value_name") is not None:
-            temp_list.append(pro.get("lookup_value_name"))
-    if temp_list:
-        case.priorities = temp_list
-    del temp_list
+    set_lookup_values(case, "priorities", legalserver_data, "priorities")
 
     if legalserver_data.get("asset_assistance") is not None:
         case.asset_assistance = legalserver_data.get("asset_assistance")
@@ -4484,15 +4314,11 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.income_change_significantly = legalserver_data.get(
             "income_change_significantly"
         )
-    if legalserver_data["income_change_type"].get("lookup_value_name") is not None:
-        case.income_change_type = legalserver_data["income_change_type"].get(
-            "lookup_value_name"
-        )
+    set_lookup_value(case, "income_change_type", legalserver_data, "income_change_type")
 
-    if legalserver_data["hud_entity_poverty_band"].get("lookup_value_name") is not None:
-        case.hud_entity_poverty_band = legalserver_data["hud_entity_poverty_band"].get(
-            "lookup_value_name"
-        )
+    set_lookup_value(
+        case, "hud_entity_poverty_band", legalserver_data, "hud_entity_poverty_band"
+    )
     if (
         legalserver_data["hud_statewide_poverty_band"].get("lookup_value_name")
         is not None
@@ -4508,10 +4334,7 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.hud_area_median_income_percentage = legalserver_data.get(
             "hud_area_median_income_percentage"
         )
-    if legalserver_data["hud_ami_category"].get("lookup_value_name") is not None:
-        case.hud_ami_category = legalserver_data["hud_ami_category"].get(
-            "lookup_value_name"
-        )
+    set_lookup_value(case, "hud_ami_category", legalserver_data, "hud_ami_category")
 
     if legalserver_data.get("sharepoint_site_library") is not None:
         if (
@@ -4525,32 +4348,157 @@ def populate_case(*, case: DAObject, legalserver_data: dict) -> DAObject:
         case.sending_site_identification_number = legalserver_data.get(
             "sending_site_identification_number"
         )
-    if legalserver_data.get("branch") is not None:
-        if legalserver_data["branch"].get("lookup_value_name") is not None:
-            case.branch = legalserver_data["branch"].get("lookup_value_name")
-    if legalserver_data.get("military_status") is not None:
-        if legalserver_data["military_status"].get("lookup_value_name") is not None:
-            case.military_status = legalserver_data["military_status"].get(
-                "lookup_value_name"
-            )
+    set_lookup_value(case, "branch", legalserver_data, "branch")
+    set_lookup_value(case, "military_status", legalserver_data, "military_status")
     if legalserver_data.get("external_id") is not None:
         case.external_id = legalserver_data.get("external_id")
 
     # Custom Fields are funny
-    standard_key_list = standard_matter_keys()
-    custom_fields = {
-        key: value
-        for key, value in legalserver_data.items()
-        if key not in standard_key_list
-    }
-    if custom_fields is not None:
-        case.custom_fields = custom_fields
+    set_custom_fields(case, legalserver_data, _STANDARD_MATTER_KEYS)
 
     log(f"LegalServer Case Object populated for a case.")
 
     return case
 
 
+def populate_matter_bundle(
+    *,
+    legalserver_site: str,
+    legalserver_matter_uuid: str,
+    custom_fields: list | None = None,
+    custom_fields_services: list | None = None,
+    custom_fields_litigations: list | None = None,
+    custom_fields_charges: list | None = None,
+    additional_name_list: DAList | None = None,
+    adverse_party_list: DAList | None = None,
+    assignment_list: DAList | None = None,
+    charge_list: DAList | None = None,
+    contact_list: DAList | None = None,
+    document_list: DAList | None = None,
+    event_list: DAList | None = None,
+    income_list: DAList | None = None,
+    litigation_list: DAList | None = None,
+    non_adverse_party_list: DAList | None = None,
+    note_list: DAList | None = None,
+    services_list: DAList | None = None,
+    task_list: DAList | None = None,
+) -> Dict:
+    """Get a LegalServer matter once and populate several lists from it.
+
+    This is a keyword defined function that makes a single `get_matter_details`
+    call and passes the response as the `legalserver_data` to the populate
+    function for every list that is supplied. Populating several lists with
+    only the `legalserver_matter_uuid` makes a separate API call for each one,
+    so this is the better choice when an interview needs more than one of them.
+    Any module that is not in the matter response is still searched for, and
+    those searches are made at the same time.
+
+    Args:
+        legalserver_site (str): required
+        legalserver_matter_uuid (str): required
+        custom_fields (list[str]): optional python list of string values
+        custom_fields_services (list[str]): optional python list of string values
+        custom_fields_litigations (list[str]): optional python list of string values
+        custom_fields_charges (list[str]): optional python list of string values
+        additional_name_list (DAList): optional list for `populate_additional_names`
+        adverse_party_list (DAList): optional list for `populate_adverse_parties`
+        assignment_list (DAList): optional list for `populate_assignments`
+        charge_list (DAList): optional list for `populate_charges`
+        contact_list (DAList): optional list for `populate_contacts`
+        document_list (DAList): optional list for `populate_documents`
+        event_list (DAList): optional list for `populate_events`
+        income_list (DAList): optional list for `populate_income`
+        litigation_list (DAList): optional list for `populate_litigations`
+        non_adverse_party_list (DAList): optional list for
+            `populate_non_adverse_parties`
+        note_list (DAList): optional list for `populate_notes`
+        services_list (DAList): optional list for `populate_services`
+        task_list (DAList): optional list for `populate_tasks`
+
+    Returns:
+        The `get_matter_details` response, so it can also be used for
+        `populate_case` and `populate_client`.
+    """
+    legalserver_data = get_matter_details(
+        legalserver_site=legalserver_site,
+        legalserver_matter_uuid=legalserver_matter_uuid,
+        custom_fields=custom_fields,
+        custom_fields_services=custom_fields_services,
+        custom_fields_litigations=custom_fields_litigations,
+        custom_fields_charges=custom_fields_charges,
+    )
+
+    modules = [
+        (populate_function, source_type, list_keyword, list_to_populate)
+        for populate_function, source_type, list_keyword, list_to_populate in (
+            (
+                populate_additional_names,
+                "additional_names",
+                "additional_name_list",
+                additional_name_list,
+            ),
+            (
+                populate_adverse_parties,
+                "adverse_parties",
+                "adverse_party_list",
+                adverse_party_list,
+            ),
+            (populate_assignments, "assignments", "assignment_list", assignment_list),
+            (populate_charges, "charges", "charge_list", charge_list),
+            (populate_contacts, "contacts", "contact_list", contact_list),
+            (populate_documents, "documents", "document_list", document_list),
+            (populate_events, "events", "event_list", event_list),
+            (populate_income, "incomes", "income_list", income_list),
+            (populate_litigations, "litigations", "litigation_list", litigation_list),
+            (
+                populate_non_adverse_parties,
+                "non_adverse_parties",
+                "non_adverse_party_list",
+                non_adverse_party_list,
+            ),
+            (populate_notes, "notes", "note_list", note_list),
+            (populate_services, "services", "services_list", services_list),
+            (populate_tasks, "tasks", "task_list", task_list),
+        )
+        if list_to_populate is not None
+    ]
+
+    # Search for every module the matter response left out at the same time,
+    # then hand the results to the populate functions along with the matter
+    # data. They are not given the matter uuid so nothing is searched twice.
+    # Each search runs on a pool worker, so it requests its own pages one at a
+    # time instead of waiting on the pool, and a bundle that is itself called
+    # from a pool worker runs its searches one at a time for the same reason.
+    bundle_data = dict(legalserver_data or {})
+    source_types_to_search = [
+        source_type
+        for _, source_type, _, _ in modules
+        if not bundle_data.get(source_type)
+    ]
+    if source_types_to_search:
+        module_map = map if running_on_executor() else _EXECUTOR.map
+        bundle_data.update(
+            zip(
+                source_types_to_search,
+                module_map(
+                    lambda source_type: get_source_module_data(
+                        source_type=source_type,
+                        legalserver_matter_uuid=legalserver_matter_uuid,
+                        legalserver_site=legalserver_site,
+                    ),
+                    source_types_to_search,
+                ),
+            )
+        )
+
+    for populate_function, _, list_keyword, list_to_populate in modules:
+        populate_function(
+            legalserver_data=bundle_data, **{list_keyword: list_to_populate}
+        )
+
+    return legalserver_data
+
+
 def get_source_module_data(
     *,
     source_type: str,
@@ -4663,7 +4611,7 @@ def get_source_module_data(
                 )
             else:
                 source = []
-        else:
+        elif not legalserver_data or legalserver_data.get(source_type) is None:
             log(
                 f"{source_type} cannot be populated because no case data or "
                 f"LegalServer case and site were supplied."
@@ -4675,9 +4623,268 @@ def get_source_module_data(
             log(f"Error is the collection of the {source_type} data: {error_string}")
             source = []
 
+    # LegalServer returns a list of records, so checking the first one is enough
+    # to let the populate functions skip the check for every record
+    if source and not isinstance(source[0], dict):
+        log(f"Unexpected {source_type} data from LegalServer: {str(source[0])}")
+        source = []
+
     return source
 
 
+# get_*_details responses keyed by (record type, site, uuid, custom fields).
+# Each entry is the time it was requested and a Future for the response, so a
+# prefetched record can be picked up by a later populate function. Expired
+# entries are dropped whenever a new request is added, and the least recently
+# used entry is dropped once the cache is full.
+_DETAILS_CACHE: Dict = {}
+_DETAILS_CACHE_LOCK = threading.Lock()
+_DETAILS_CACHE_SECONDS = 300
+_DETAILS_CACHE_SIZE = 256
+
+
+def details_cache_key(
+    *,
+    record_type: str,
+    legalserver_site: str,
+    uuid: str,
+    custom_fields: List | None = None,
+) -> tuple:
+    """Helper function to build the `_DETAILS_CACHE` key for a record. The
+    custom fields are sorted so the same fields in a different order share an
+    entry."""
+    return (record_type, legalserver_site, uuid, tuple(sorted(custom_fields or [])))
+
+
+def details_future(
+    *,
+    record_type: str,
+    legalserver_site: str,
+    uuid: str,
+    custom_fields: List | None = None,
+) -> Future:
+    """Helper function to start or reuse a `get_*_details` request.
+
+    Args:
+        record_type (str): one of `matters`, `contacts`, `organizations`, or
+            `users`.
+        legalserver_site (str): required
+        uuid (str): the uuid of the record to get.
+        custom_fields (list): Optional list to include any custom fields
+
+    Returns:
+        A Future for the response.
+    """
+    key = details_cache_key(
+        record_type=record_type,
+        legalserver_site=legalserver_site,
+        uuid=uuid,
+        custom_fields=custom_fields,
+    )
+    details_function, uuid_keyword = _DETAILS_FUNCTIONS[record_type]
+    now = time.monotonic()
+    with _DETAILS_CACHE_LOCK:
+        cached = _DETAILS_CACHE.pop(key, None)
+        if cached is not None and now - cached[0] < _DETAILS_CACHE_SECONDS:
+            _DETAILS_CACHE[key] = cached
+            return cached[1]
+        for expired_key in [
+            cached_key
+            for cached_key, (requested, _) in _DETAILS_CACHE.items()
+            if now - requested >= _DETAILS_CACHE_SECONDS
+        ]:
+            del _DETAILS_CACHE[expired_key]
+        future = _EXECUTOR.submit(
+            details_function,
+            legalserver_site=legalserver_site,
+            custom_fields=custom_fields,
+            **{uuid_keyword: uuid},
+        )
+        _DETAILS_CACHE[key] = (now, future)
+        if len(_DETAILS_CACHE) > _DETAILS_CACHE_SIZE:
+            _DETAILS_CACHE.pop(next(iter(_DETAILS_CACHE)))
+    future.add_done_callback(lambda done: discard_failed_details(key=key, future=done))
+    return future
+
+
+def discard_failed_details(*, key: tuple, future: Future) -> None:
+    """Helper function to drop a `_DETAILS_CACHE` entry whose request raised
+    an exception, so the next call requests the record again."""
+    if future.exception() is None:
+        return
+    with _DETAILS_CACHE_LOCK:
+        cached = _DETAILS_CACHE.get(key)
+        if cached is not None and cached[1] is future:
+            del _DETAILS_CACHE[key]
+
+
+def get_cached_details(
+    *,
+    record_type: str,
+    legalserver_site: str,
+    uuid: str,
+    custom_fields: List | None = None,
+) -> Dict:
+    """Helper function to get a `get_*_details` response, reusing a recent
+    request for the same record. Error responses are not kept. A call from a
+    pool worker makes the request itself instead of waiting on the pool."""
+    if running_on_executor():
+        details_function, uuid_keyword = _DETAILS_FUNCTIONS[record_type]
+        return details_function(
+            legalserver_site=legalserver_site,
+            custom_fields=custom_fields,
+            **{uuid_keyword: uuid},
+        )
+    future = details_future(
+        record_type=record_type,
+        legalserver_site=legalserver_site,
+        uuid=uuid,
+        custom_fields=custom_fields,
+    )
+    return_data = future.result()
+    if return_data.get("error") is not None:
+        key = details_cache_key(
+            record_type=record_type,
+            legalserver_site=legalserver_site,
+            uuid=uuid,
+            custom_fields=custom_fields,
+        )
+        with _DETAILS_CACHE_LOCK:
+            cached = _DETAILS_CACHE.get(key)
+            if cached is not None and cached[1] is future:
+                del _DETAILS_CACHE[key]
+        return return_data
+    return copy.deepcopy(return_data)
+
+
+def get_cached_user_details(
+    *,
+    legalserver_site: str,
+    legalserver_user_uuid: str,
+    custom_fields: List | None = None,
+) -> Dict:
+    """Get the details on a LegalServer user, reusing a recent request.
+
+    This returns the same data as `get_user_details`, but a user that was
+    already requested or prefetched in the last few minutes is not requested
+    again. Error responses are not kept.
+
+    Args:
+        legalserver_site (str): required
+        legalserver_user_uuid (str): required
+        custom_fields (list): Optional list to include any custom fields
+
+    Returns:
+        A dictionary with the specific user data.
+    """
+    return get_cached_details(
+        record_type="users",
+        legalserver_site=legalserver_site,
+        uuid=legalserver_user_uuid,
+        custom_fields=custom_fields,
+    )
+
+
+def get_cached_contact_details(
+    *,
+    legalserver_site: str,
+    legalserver_contact_uuid: str,
+    custom_fields: List | None = None,
+) -> Dict:
+    """Get details about a specific Contact record, reusing a recent request.
+
+    This returns the same data as `get_contact_details`, but a contact that
+    was already requested in the last few minutes is not requested again.
+    Error responses are not kept.
+
+    Args:
+        legalserver_site (str): required
+        legalserver_contact_uuid (str): required
+        custom_fields (list): Optional list to include any custom fields
+
+    Returns:
+        A dictionary for the specific contact.
+    """
+    return get_cached_details(
+        record_type="contacts",
+        legalserver_site=legalserver_site,
+        uuid=legalserver_contact_uuid,
+        custom_fields=custom_fields,
+    )
+
+
+def get_cached_organization_details(
+    *,
+    legalserver_site: str,
+    legalserver_organization_uuid: str,
+    custom_fields: List | None = None,
+) -> Dict:
+    """Get details about a specific Organization, reusing a recent request.
+
+    This returns the same data as `get_organization_details`, but an
+    organization that was already requested in the last few minutes is not
+    requested again. Error responses are not kept.
+
+    Args:
+        legalserver_site (str): required
+        legalserver_organization_uuid (str): required
+        custom_fields (list): Optional list to include any custom fields
+
+    Returns:
+        A dictionary for the specific organization.
+    """
+    return get_cached_details(
+        record_type="organizations",
+        legalserver_site=legalserver_site,
+        uuid=legalserver_organization_uuid,
+        custom_fields=custom_fields,
+    )
+
+
+def prefetch_assignment_users(
+    *,
+    assignment_list: DAList,
+    legalserver_site: str,
+    user_custom_fields: List | None = None,
+) -> None:
+    """Start fetching the users for the open Primary assignment and the first
+    and latest open Pro Bono assignments.
+
+    The requests run in the background, so the populate functions for these
+    assignments only wait for the users they need and the same user is not
+    requested twice. `populate_pro_bono_assignments` requests the rest of the
+    Pro Bono users itself.
+
+    Args:
+        assignment_list (DAList[DAObject]): DAList of DAObjects
+        legalserver_site (str): required
+        user_custom_fields (list): Optional list of custom fields to gather on
+            the User record.
+
+    Returns:
+        None.
+    """
+    user_uuids = []
+    for assignment in assignment_list:
+        if isinstance(assignment, DAObject):
+            if assignment.end_date is None and assignment.type == "Primary":
+                user_uuids.append(assignment.user_uuid)
+                break
+    first_uuid, _, latest_uuid, _ = scan_pro_bono_assignments(
+        assignment_list=assignment_list
+    )
+    user_uuids.append(first_uuid)
+    user_uuids.append(latest_uuid)
+    for user_uuid in dict.fromkeys(user_uuids):
+        if user_uuid is not None:
+            details_future(
+                record_type="users",
+                legalserver_site=legalserver_site,
+                uuid=user_uuid,
+                custom_fields=user_custom_fields,
+            )
+
+
 def populate_primary_assignment(
     *,
     primary_assignment: Individual,
@@ -4705,18 +4912,23 @@ def populate_primary_assignment(
     Returns:
         The supplied Individual object.
     """
-    if len(assignment_list) == 0:
+    if not getattr(assignment_list, "gathered", False):
         assignment_list = populate_assignments(
             assignment_list=assignment_list,
             legalserver_data=legalserver_data,
             legalserver_matter_uuid=legalserver_matter_uuid,
             legalserver_site=legalserver_site,
         )
+    prefetch_assignment_users(
+        assignment_list=assignment_list,
+        legalserver_site=legalserver_site,
+        user_custom_fields=user_custom_fields,
+    )
     for assignment in assignment_list:
         if isinstance(assignment, DAObject):
             if assignment.end_date is None and assignment.type == "Primary":
                 primary_assignment.user_uuid = assignment.user_uuid
-                user_data = get_user_details(
+                user_data = get_cached_user_details(
                     legalserver_site=legalserver_site,
                     legalserver_user_uuid=primary_assignment.user_uuid,
                     custom_fields=user_custom_fields,
@@ -4724,9 +4936,49 @@ def populate_primary_assignment(
                 primary_assignment = populate_user_data(
                     user=primary_assignment, user_data=user_data
                 )
+                break
     return primary_assignment
 
 
+def scan_pro_bono_assignments(*, assignment_list: DAList) -> tuple:
+    """Find the earliest and latest open Pro Bono assignments in one pass.
+
+    The start dates from LegalServer are ISO formatted strings, so they are
+    compared directly. Assignments that start today or later are not counted
+    as the earliest one.
+
+    Args:
+        assignment_list (DAList[DAObject]): DAList of DAObjects
+
+    Returns:
+        A tuple of the user uuid and start date of the earliest assignment,
+        followed by the user uuid and start date of the latest assignment.
+        Each is None when there is no matching assignment.
+    """
+    today = current_datetime().strftime("%Y-%m-%d")
+    first = latest = None
+    for assignment in assignment_list:
+        if isinstance(assignment, DAObject):
+            if (
+                assignment.end_date is None
+                and assignment.type == "Pro Bono"
+                and assignment.start_date is not None
+            ):
+                start_date = str(assignment.start_date)[:10]
+                if start_date < today and (first is None or start_date < first[0]):
+                    first = (start_date, assignment)
+                if latest is None or start_date > latest[0]:
+                    latest = (start_date, assignment)
+    first_uuid = first_date = latest_uuid = latest_date = None
+    if first is not None:
+        first_uuid = first[1].user_uuid
+        first_date = first[1].start_date
+    if latest is not None:
+        latest_uuid = latest[1].user_uuid
+        latest_date = latest[1].start_date
+    return first_uuid, first_date, latest_uuid, latest_date
+
+
 def populate_first_pro_bono_assignment(
     *,
     legalserver_first_pro_bono_assignment: Individual,
@@ -4755,38 +5007,35 @@ def populate_first_pro_bono_assignment(
     Returns:
         The supplied Individual object.
     """
-    if len(assignment_list) == 0:
+    if not getattr(assignment_list, "gathered", False):
         assignment_list = populate_assignments(
             assignment_list=assignment_list,
             legalserver_data=legalserver_data,
             legalserver_matter_uuid=legalserver_matter_uuid,
             legalserver_site=legalserver_site,
         )
-    legalserver_first_pro_bono_assignment.assignment_start_date = current_datetime()
-    for assignment in assignment_list:
-        if isinstance(assignment, DAObject):
-            if assignment.end_date is None and assignment.type == "Pro Bono":
-                if (
-                    date_difference(
-                        assignment.start_date,
-                        legalserver_first_pro_bono_assignment.assignment_start_date,
-                    ).days  # type: ignore
-                    > 0
-                ):
-                    legalserver_first_pro_bono_assignment.user_uuid = (
-                        assignment.user_uuid
-                    )
-                    legalserver_first_pro_bono_assignment.assignment_start_date = (
-                        assignment.start_date
-                    )
-                    user_data = get_user_details(
-                        legalserver_site=legalserver_site,
-                        legalserver_user_uuid=legalserver_first_pro_bono_assignment.user_uuid,
-                        custom_fields=user_custom_fields,
-                    )
-                    legalserver_first_pro_bono_assignment = populate_user_data(
-                        user=legalserver_first_pro_bono_assignment, user_data=user_data
-                    )
+    prefetch_assignment_users(
+        assignment_list=assignment_list,
+        legalserver_site=legalserver_site,
+        user_custom_fields=user_custom_fields,
+    )
+    first_uuid, first_date, _, _ = scan_pro_bono_assignments(
+        assignment_list=assignment_list
+    )
+    if first_uuid is not None:
+        legalserver_first_pro_bono_assignment.user_uuid = first_uuid
+        legalserver_first_pro_bono_assignment.assignment_start_date = first_date
+        user_data = get_cached_user_details(
+            legalserver_site=legalserver_site,
+            legalserver_user_uuid=legalserver_first_pro_bono_assignment.user_uuid,
+            custom_fields=user_custom_fields,
+        )
+        legalserver_first_pro_bono_assignment = populate_user_data(
+            user=legalserver_first_pro_bono_assignment, user_data=user_data
+        )
+    else:
+        # no open Pro Bono assignment was found
+        legalserver_first_pro_bono_assignment.assignment_start_date = current_datetime()
     return legalserver_first_pro_bono_assignment
 
 
@@ -4818,40 +5067,36 @@ def populate_latest_pro_bono_assignment(
     Returns:
         The supplied Individual object.
     """
-    if len(assignment_list) == 0:
+    if not getattr(assignment_list, "gathered", False):
         assignment_list = populate_assignments(
             assignment_list=assignment_list,
             legalserver_data=legalserver_data,
             legalserver_matter_uuid=legalserver_matter_uuid,
             legalserver_site=legalserver_site,
         )
-    legalserver_latest_pro_bono_assignment.assignment_start_date = (
-        date.today() - date_interval(years=100)
+    prefetch_assignment_users(
+        assignment_list=assignment_list,
+        legalserver_site=legalserver_site,
+        user_custom_fields=user_custom_fields,
     )
-    for assignment in assignment_list:
-        if isinstance(assignment, DAObject):
-            if assignment.end_date is None and assignment.type == "Pro Bono":
-                if (
-                    date_difference(
-                        assignment.start_date,
-                        legalserver_latest_pro_bono_assignment.assignment_start_date,
-                    ).days  # type: ignore
-                    < 0
-                ):
-                    legalserver_latest_pro_bono_assignment.user_uuid = (
-                        assignment.user_uuid
-                    )
-                    legalserver_latest_pro_bono_assignment.assignment_start_date = (
-                        assignment.start_date
-                    )
-                    user_data = get_user_details(
-                        legalserver_site=legalserver_site,
-                        legalserver_user_uuid=legalserver_latest_pro_bono_assignment.user_uuid,
-                        custom_fields=user_custom_fields,
-                    )
-                    legalserver_latest_pro_bono_assignment = populate_user_data(
-                        user=legalserver_latest_pro_bono_assignment, user_data=user_data
-                    )
+    _, _, latest_uuid, latest_date = scan_pro_bono_assignments(
+        assignment_list=assignment_list
+    )
+    if latest_uuid is not None:
+        legalserver_latest_pro_bono_assignment.user_uuid = latest_uuid
+        legalserver_latest_pro_bono_assignment.assignment_start_date = latest_date
+        user_data = get_cached_user_details(
+            legalserver_site=legalserver_site,
+            legalserver_user_uuid=legalserver_latest_pro_bono_assignment.user_uuid,
+            custom_fields=user_custom_fields,
+        )
+        legalserver_latest_pro_bono_assignment = populate_user_data(
+            user=legalserver_latest_pro_bono_assignment, user_data=user_data
+        )
+    else:
+        legalserver_latest_pro_bono_assignment.assignment_start_date = (
+            date.today() - date_interval(years=100)
+        )
     return legalserver_latest_pro_bono_assignment
 
 
@@ -4877,6 +5122,7 @@ def populate_current_user(
         The supplied Individual object.
     """
 
+    # always ask LegalServer so the current user's record is never stale
     user_data = get_user_details(
         legalserver_site=legalserver_site,
         legalserver_user_uuid=legalserver_current_user_uuid,
@@ -4888,11 +5134,51 @@ def populate_current_user(
     return legalserver_current_user
 
 
+# User fields for copy_fields. `additional_offices` is replaced by the list
+# of office names below when any are present.
+_USER_NAME_FIELDS = ("first", "middle", "last")
+_USER_FIELDS = (
+    "email",
+    "email_allow",
+    "login",
+    "active",
+    "current",
+    "contact_active",
+    "date_start",
+    "date_end",
+    "date_graduated",
+    "date_bar_join",
+    "bar_number",
+    "date_joined_panel",
+    "external_unique_id",
+    "additional_offices",
+    "external_guid",
+    "highest_court_admitted",
+    "phone_business",
+    "phone_fax",
+    "phone_home",
+    "phone_mobile",
+    "phone_other",
+    "practice_state",
+    "school_attended",
+    "bind_work_address_to_organization",
+    "hourly_rate",
+    "contact_types",
+    "address_home",
+    "address_work",
+)
+_USER_LOOKUP_FIELDS = ("role", "program", "member_good_standing", "recruitment")
+
+
 def populate_user_data(*, user: Individual, user_data: Dict) -> Individual:
     """
     This is a keyword defined function that helps populate an Individual record
     with details from the Get User API response.
 
+    Any keys that are not in the standard key list are saved to a
+    `custom_fields` dictionary on the object. That attribute is only set when at
+    least one custom field is present.
+
     Args:
         user (Individual): The Individual object to be populated and returned.
         user_data (Dict): The get_user_details() response dictionary that has
@@ -4903,246 +5189,73 @@ def populate_user_data(*, user: Individual, user_data: Dict) -> Individual:
     """
     user.id = user_data.get("id")
     user.user_uuid = user_data.get("user_uuid")
-    if user_data.get("first") is not None:
-        user.name.first = user_data.get("first")
-    if user_data.get("middle") is not None:
-        user.name.middle = user_data.get("middle")
-    if user_data.get("last") is not None:
-        user.name.last = user_data.get("last")
-    if user_data.get("email") is not None:
-        user.email = user_data.get("email")
-    if user_data.get("email_allow") is not None:
-        user.email_allow = user_data.get("email_allow")
-    if user_data.get("login") is not None:
-        user.login = user_data.get("login")
-    if user_data.get("active") is not None:
-        user.active = user_data.get("active")
-    if user_data.get("current") is not None:
-        user.current = user_data.get("current")
-    if user_data.get("contact_active") is not None:
-        user.contact_active = user_data.get("contact_active")
-
-    temp_list = []
-    for type in user_data["types"]:
-        if type.get("lookup_value_name") is not None:
-            temp_list.append(type.get("lookup_value_name"))
-    if temp_list:
-        user.types = temp_list
-    del temp_list
-
-    if user_data["role"].get("lookup_value_name") is not None:
-        user.role = user_data["role"].get("lookup_value_name")
-
-    if user_data["gender"].get("lookup_value_name") is not None:
-        user.role = user_data["gender"].get("lookup_value_name")
-
-    if user_data["race"].get("lookup_value_name") is not None:
-        user.role = user_data["race"].get("lookup_value_name")
-    if user_data.get("dob") is not None:
-        user.birthdate = user_data.get("dob")
-    if user_data.get("office") is not None:
-        if user_data["office"].get("office_name") is not None:
-            user.office = user_data.get("office")
-    if user_data["program"].get("lookup_value_name") is not None:
-        user.program = user_data["program"].get("lookup_value_name")
-    if user_data.get("date_start") is not None:
-        user.date_start = user_data.get("date_start")
-    if user_data.get("date_end") is not None:
-        user.date_end = user_data.get("date_end")
-
-    if user_data.get("date_graduated") is not None:
-        user.date_graduated = user_data.get("date_graduated")
-    if user_data.get("date_bar_join") is not None:
-        user.date_bar_join = user_data.get("date_bar_join")
-    if user_data.get("bar_number") is not None:
-        user.bar_number = user_data.get("bar_number")
-    if user_data.get("date_joined_panel") is not None:
-        user.date_joined_panel = user_data.get("date_joined_panel")
-    if user_data.get("external_unique_id") is not None:
-        user.external_unique_id = user_data.get("external_unique_id")
-
-    temp_list = []
-    for program in user_data["additional_programs"]:
-        if program.get("lookup_value_name") is not None:
-            temp_list.append(program.get("lookup_value_name"))
-    if temp_list:
-        user.additional_programs = temp_list
-    del temp_list
-
-    if user_data.get("additional_offices") is not None:
-        user.additional_offices = user_data.get("additional_offices")
-
-    temp_list = []
-    for office in user_data["additional_offices"]:
+    copy_fields(user.name, user_data, _USER_NAME_FIELDS)
+    copy_fields(user, user_data, _USER_FIELDS, _USER_LOOKUP_FIELDS)
+
+    birthdate = user_data.get("dob")
+    if birthdate is not None:
+        user.birthdate = birthdate
+    salutation = user_data.get("salutation")
+    if salutation is not None:
+        user.salutation_to_use = salutation
+
+    set_lookup_values(user, "types", user_data, "types")
+
+    gender = (user_data.get("gender") or {}).get("lookup_value_name")
+    if gender is not None:
+        user.role = gender
+
+    race = (user_data.get("race") or {}).get("lookup_value_name")
+    if race is not None:
+        user.role = race
+    office = user_data.get("office")
+    if office is not None:
         if office.get("office_name") is not None:
-            temp_list.append(office.get("office_name"))
-    if temp_list:
-        user.additional_offices = temp_list
-    del temp_list
-
-    if user_data.get("external_guid") is not None:
-        user.external_guid = user_data.get("external_guid")
-
-    if user_data.get("highest_court_admitted") is not None:
-        user.highest_court_admitted = user_data.get("highest_court_admitted")
-
-    temp_list = []
-    for language in user_data["languages"]:
-        if language.get("lookup_value_name") is not None:
-            temp_list.append(language.get("lookup_value_name"))
-    if temp_list:
-        user.languages = temp_list
-    del temp_list
-
-    if user_data.get("phone_business") is not None:
-        user.phone_business = user_data.get("phone_business")
-    if user_data.get("phone_fax") is not None:
-        user.phone_fax = user_data.get("phone_fax")
-    if user_data.get("phone_home") is not None:
-        user.phone_home = user_data.get("phone_home")
-    if user_data.get("phone_mobile") is not None:
-        user.phone_mobile = user_data.get("phone_mobile")
-    if user_data.get("phone_other") is not None:
-        user.phone_other = user_data.get("phone_other")
-    if user_data.get("practice_state") is not None:
-        user.practice_state = user_data.get("practice_state")
-    if user_data["member_good_standing"].get("lookup_value_name") is not None:
-        user.member_good_standing = user_data["member_good_standing"].get(
-            "lookup_value_name"
-        )
-    if user_data["recruitment"].get("lookup_value_name") is not None:
-        user.recruitment = user_data["recruitment"].get("lookup_value_name")
-    if user_data.get("salutation") is not None:
-        user.salutation_to_use = user_data.get("salutation")
-    if user_data.get("school_attended") is not None:
-        user.school_attended = user_data.get("school_attended")
-    if user_data.get("bind_work_address_to_organization") is not None:
-        user.bind_work_address_to_organization = user_data.get(
-            "bind_work_address_to_organization"
-        )
-    if user_data.get("hourly_rate") is not None:
-        user.hourly_rate = user_data.get("hourly_rate")
-
-    temp_list = []
-    temp_list2 = []
-    for county in user_data["counties"]:
-        if county.get("lookup_value_name") is not None:
-            temp_list.append(county.get("lookup_value_name"))
-            temp_list2.append(county.get("lookup_value_FIPS"))
-    if temp_list:
-        user.counties = temp_list
-        user.counties_FIPS = temp_list2
-    del temp_list
-    del temp_list2
-
-    if user_data.get("contact_types") is not None:
-        user.contact_types = user_data.get("contact_types")
-
-    if user_data.get("address_home") is not None:
-        user.address_home = user_data.get("address_home")
-
-    if user_data.get("address_work") is not None:
-        user.address_work = user_data.get("address_work")
-
-    temp_list = []
-    for type in user_data["types"]:
-        if type.get("lookup_value_name") is not None:
-            temp_list.append(type.get("lookup_value_name"))
-    if temp_list:
-        user.types = temp_list
-    del temp_list
+            user.office = office
+
+    set_lookup_values(user, "additional_programs", user_data, "additional_programs")
+
+    additional_offices = [
+        office.get("office_name")
+        for office in user_data.get("additional_offices") or ()
+        if office.get("office_name") is not None
+    ]
+    if additional_offices:
+        user.additional_offices = additional_offices
+
+    set_lookup_values(user, "languages", user_data, "languages")
+
+    counties = [
+        county
+        for county in user_data.get("counties") or ()
+        if county.get("lookup_value_name") is not None
+    ]
+    if counties:
+        user.counties = [county["lookup_value_name"] for county in counties]
+        user.counties_FIPS = [county.get("lookup_value_FIPS") for county in counties]
 
     # Work Address
-    if user_data.get("address_work") is not None:
-        if user_data["address_work"].get("street") is not None:
-            user.address.address = user_data["address_work"].get("street")
-        ## LS Supports both Apt Num and Street2
-        if (
-            user_data["address_work"].get("street_2") is not None
-            and user_data["address_work"].get("apt_num") is None
-        ):
-            user.address.unit = user_data["address_work"].get("street_2")
-        if (
-            user_data["address_work"].get("apt_num") is not None
-            and user_data["address_work"].get("street_2") is None
-        ):
-            user.address.unit = user_data["address_work"].get("apt_num")
-        if (
-            user_data["address_work"].get("apt_num") is not None
-            and user_data["address_work"].get("street_2") is not None
-        ):
-            user.address.unit = user_data["address_work"].get("apt_num")
-            if user.address.address is None:
-                user.address.address = user_data["address_work"].get("street_2")
-            else:
-                user.address.address = f'{user.address.address}, {user_data["address_work"].get("street_2")}'
-        if user_data["address_work"].get("city") is not None:
-            user.address.city = user_data["address_work"].get("city")
-        if user_data["address_work"].get("state") is not None:
-            user.address.state = user_data["address_work"].get("state")
-        if user_data["address_work"].get("zip") is not None:
-            user.address.zip = user_data["address_work"].get("zip")
+    address_work = user_data.get("address_work")
+    if address_work is not None:
+        populate_address(address=user.address, address_data=address_work)
 
     # Home Address
-    if user_data.get("address_home") is not None:
-        if (
-            user_data["address_home"].get("street") is not None
-            or user_data["address_home"].get("apt_num") is not None
-            or user_data["address_home"].get("street_2") is not None
-            or user_data["address_home"].get("city") is not None
-            or user_data["address_home"].get("state") is not None
-            or user_data["address_home"].get("zip") is not None
-        ):
-            user.initializeAttribute("home_address", Address)
+    populate_optional_address(
+        target=user,
+        attribute="home_address",
+        address_data=user_data.get("address_home"),
+    )
 
-        if user_data["address_home"].get("street") is not None:
-            user.home_address.address = user_data["address_home"].get("street")
-        ## LS Supports both Apt Num and Street2
-        if (
-            user_data["address_home"].get("street_2") is not None
-            and user_data["address_home"].get("apt_num") is None
-        ):
-            user.home_address.unit = user_data["address_home"].get("street_2")
-        if (
-            user_data["address_home"].get("apt_num") is not None
-            and user_data["address_home"].get("street_2") is None
-        ):
-            user.home_address.unit = user_data["address_home"].get("apt_num")
-        if (
-            user_data["address_home"].get("apt_num") is not None
-            and user_data["address_home"].get("street_2") is not None
-        ):
-            user.home_address.unit = user_data["address_home"].get("apt_num")
-            if user.home_address.address is None:
-                user.home_address.address = user_data["address_home"].get("street_2")
-            else:
-                user.home_address.address = f'{user.home_address.address}, {user_data["address_home"].get("street_2")}'
-        if user_data["address_home"].get("city") is not None:
-            user.home_address.city = user_data["address_home"].get("city")
-        if user_data["address_home"].get("state") is not None:
-            user.home_address.state = user_data["address_home"].get("state")
-        if user_data["address_home"].get("zip") is not None:
-            user.home_address.zip = user_data["address_home"].get("zip")
-
-    if user_data.get("dynamic_process") is not None:
-        user.dynamic_process_id = user_data["dynamic_process"].get("dynamic_process_id")
-        user.dynamic_process_uuid = user_data["dynamic_process"].get(
-            "dynamic_process_uuid"
-        )
-        user.dynamic_process_name = user_data["dynamic_process"].get(
-            "dynamic_process_name"
-        )
+    dynamic_process = user_data.get("dynamic_process")
+    if dynamic_process is not None:
+        user.dynamic_process_id = dynamic_process.get("dynamic_process_id")
+        user.dynamic_process_uuid = dynamic_process.get("dynamic_process_uuid")
+        user.dynamic_process_name = dynamic_process.get("dynamic_process_name")
 
     if user_data.get("organization_affiliation") is not None:
         user.organization = 1
 
-    standard_key_list = standard_user_keys()
-    custom_fields = {
-        key: value for key, value in user_data.items() if key not in standard_key_list
-    }
-    if custom_fields is not None:
-        user.custom_fields = custom_fields
-    del custom_fields
+    set_custom_fields(user, user_data, _STANDARD_USER_KEYS)
 
     return user
 
@@ -5176,6 +5289,9 @@ def populate_pro_bono_assignments(
     `populate_assignment()` run first so that it can parse the list of assignments
     on the case for the current primary assignment.
 
+    All of the Pro Bono users are requested at the same time in the background,
+    so the total wait is about as long as the slowest request.
+
     Args:
         pro_bono_assignment_list (DAList[Individual]): DAList object of
             Individual objects that will be returned
@@ -5189,28 +5305,36 @@ def populate_pro_bono_assignments(
     Returns:
         The supplied DAList of Individuals.
     """
-    pro_bono_list = []
-    if len(assignment_list) == 0:
+    if not getattr(assignment_list, "gathered", False):
         assignment_list = populate_assignments(
             assignment_list=assignment_list,
             legalserver_data=legalserver_data,
             legalserver_matter_uuid=legalserver_matter_uuid,
             legalserver_site=legalserver_site,
         )
-    for item in assignment_list:
-        if isinstance(item, DAObject):
-            if item.type == "Pro Bono" and item.end_date is None:
-                pro_bono_list.append({"uuid": item.user_uuid})
-    for item in pro_bono_list:
-        if isinstance(item, dict):
-            new_user = Individual()
-            user_data = get_user_details(
-                legalserver_site=legalserver_site,
-                legalserver_user_uuid=item["uuid"],
-                custom_fields=user_custom_fields,
-            )
-            new_user = populate_user_data(user=new_user, user_data=user_data)
-            pro_bono_assignment_list.append(new_user)
+    pro_bono_uuids = [
+        item.user_uuid
+        for item in assignment_list
+        if isinstance(item, DAObject)
+        and item.type == "Pro Bono"
+        and item.end_date is None
+    ]
+    for user_uuid in dict.fromkeys(pro_bono_uuids):
+        details_future(
+            record_type="users",
+            legalserver_site=legalserver_site,
+            uuid=user_uuid,
+            custom_fields=user_custom_fields,
+        )
+    for user_uuid in pro_bono_uuids:
+        new_user = Individual()
+        user_data = get_cached_user_details(
+            legalserver_site=legalserver_site,
+            legalserver_user_uuid=user_uuid,
+            custom_fields=user_custom_fields,
+        )
+        new_user = populate_user_data(user=new_user, user_data=user_data)
+        pro_bono_assignment_list.append(new_user)
 
     pro_bono_assignment_list.gathered = True
 
@@ -5270,7 +5394,7 @@ def get_legalserver_report_data(
         log(
             f"Attempting to retrive the following report {str(report_params)} from {legalserver_site}"
         )
-        response = requests.get(
+        response = _SESSION.get(
             headers=header_content, url=url, params=report_params, timeout=(3, 30)
         )
         response.raise_for_status()
@@ -5304,7 +5428,7 @@ def get_legalserver_report_data(
 
         elif "application/json" in content_type:
             # The response is already JSON
-            dict_response = response.json()
+            dict_response = decode_response(response)
 
     except etree.ParseError as e:
         log(f"LegalServer report with {str(report_params)} failed: {e}")